@@ -0,0 +1,183 @@
+import matplotlib
+import os
+
+# pandas/pyplot/seaborn are imported inside the functions: seaborn alone
+# pulls in scipy and the font cache, which is wasted work when this module
+# is merely imported or exits early on a bad path.
+
+# Method levels for the categorical axis: categorical codes instead of
+# repeated strings keep the melted frames small and speed up plotting.
+_METHOD_LEVELS = ['Heuristic', 'Naive', 'Optimal']
+
+# The method suffixes are a known, fixed set — a static map is one hash
+# lookup per row instead of a str.replace pass plus title-casing.
+_SUFFIX_MAP = {'heuristic': 'Heuristic', 'naive': 'Naive', 'optimal': 'Optimal'}
+
+# Only these columns are ever used; naming them lets read_excel skip the
+# unused cells and the dtype map skips the type-inference pass.
+_RESULT_COLS = ['scenarioID', 'scenario_description',
+                'obj heuristic', 'obj naive', 'obj optimal',
+                'time heuristic', 'time naive', 'time optimal']
+_RESULT_DTYPES = {'scenarioID': 'int16',
+                  'obj heuristic': 'float32', 'obj naive': 'float32',
+                  'obj optimal': 'float32',
+                  'time heuristic': 'float32', 'time naive': 'float32',
+                  'time optimal': 'float32'}
+
+def _load_results(results_excel_path, usecols=_RESULT_COLS, dtype=_RESULT_DTYPES):
+    """
+    Loads the results table, caching the slow Excel read as a Feather sidecar.
+    The first call parses the .xlsx and writes <path>.feather next to it;
+    later calls read the sidecar directly (columnar binary, much faster).
+    """
+    import pandas as pd
+
+    cache_path = results_excel_path + ".feather"
+    if (os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(results_excel_path)):
+        df = pd.read_feather(cache_path)
+    else:
+        # the sidecar always holds the full sheet: different callers ask
+        # for different column subsets, so narrowing happens after the
+        # read, never in what gets cached
+        df = pd.read_excel(results_excel_path)
+        try:
+            df.to_feather(cache_path)
+        except Exception as e:
+            print(f"Could not write Feather cache ({e}), continuing without it.")
+
+    df = df[list(usecols)]
+    return df.astype({k: v for k, v in dtype.items() if k in df.columns})
+
+def evaluate_results(results_excel_path, save_dir="Experiments/Plots", show=False):
+    """
+    Builds the objective violin plot, the computation-time bar chart and
+    the optimality-gap bar chart from an experiment_results.xlsx.
+    Saves the figures into save_dir, or displays them when show=True.
+    """
+    if not show:
+        matplotlib.use('Agg')  # save-only: no GUI backend needed
+
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    df = _load_results(results_excel_path)
+    if save_dir is not None:
+        os.makedirs(save_dir, exist_ok=True)
+
+    method_dtype = pd.CategoricalDtype(_METHOD_LEVELS)
+
+    # Fix the scenario order (by scenarioID) once, up front: every reshape
+    # below inherits it from the ordered Categorical, and every plot gets
+    # the same explicit order instead of seaborn re-deriving one per chart.
+    scenario_order = df.sort_values("scenarioID")["scenario_description"].drop_duplicates().tolist()
+    df['scenario_description'] = pd.Categorical(
+        df['scenario_description'], categories=scenario_order, ordered=True
+    )
+
+    # Gaps on the wide frame, so the aggregation below covers them too.
+    # Space-separated names keep them reshapeable together with obj/time.
+    # One broadcast over the stacked obj columns instead of per-column
+    # Series arithmetic (fewer temporaries, one pass).
+    obj = df[['obj heuristic', 'obj naive']].to_numpy()
+    opt = df['obj optimal'].to_numpy()[:, None]
+    df[['gap heuristic', 'gap naive']] = (obj - opt) / opt
+
+    # One groupby pass produces every per-scenario mean the bar charts need.
+    agg = (
+        df.groupby(['scenarioID', 'scenario_description'], observed=True, sort=False)
+          .mean(numeric_only=True)
+          .reset_index()
+          .sort_values('scenarioID')
+    )
+
+    # One wide_to_long per frame replaces the three independent melts: the
+    # per-instance tidy frame feeds the violin plot, the per-scenario one
+    # feeds both bar charts.
+    df['_row'] = range(len(df))
+    tidy = pd.wide_to_long(
+        df, ['obj', 'time', 'gap'],
+        i=['_row', 'scenarioID', 'scenario_description'],
+        j='method', sep=' ', suffix=r'\w+'
+    ).reset_index()
+    tidy['method'] = tidy['method'].map(_SUFFIX_MAP).astype(method_dtype)
+
+    summary = pd.wide_to_long(
+        agg, ['obj', 'time', 'gap'],
+        i=['scenarioID', 'scenario_description'],
+        j='method', sep=' ', suffix=r'\w+'
+    ).reset_index()
+    summary['method'] = summary['method'].map(_SUFFIX_MAP).astype(method_dtype)
+
+    def _finish(fig, filename):
+        fig.tight_layout()
+        if show:
+            plt.show()
+        else:
+            fig.savefig(os.path.join(save_dir, filename))
+
+    # One Figure is reused for all three plots (fig.clf() between them)
+    # instead of paying figure construction and teardown three times.
+    fig = plt.figure(figsize=(14, 6))
+
+    # --- Objective Value Violin Plot ---
+    ax = fig.add_subplot(111)
+    sns.violinplot(
+        data=tidy,
+        x='scenario_description',
+        y='obj',
+        hue='method',
+        split=False,
+        inner="quartile",
+        order=scenario_order,
+        ax=ax
+    )
+    ax.set_xlabel("")  # Remove x-axis label
+    ax.set_ylabel("Objective Value")
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.grid(axis='y', linestyle='--', alpha=0.5)
+    ax.legend_.set_title("")  # Remove legend title
+    _finish(fig, "objective_violin.svg")
+    fig.clf()
+
+    # --- Computation Time Bar Chart ---
+    ax = fig.add_subplot(111)
+    sns.barplot(
+        data=summary,
+        x='scenario_description',
+        y='time',
+        hue='method',
+        order=scenario_order,
+        ax=ax
+    )
+    ax.set_xlabel("")  # Remove x-axis label
+    ax.set_ylabel("Computation Time (log scale)")
+    ax.set_yscale('log')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.grid(axis='y', linestyle='--', alpha=0.5)
+    ax.legend_.set_title("")  # Remove legend title
+    _finish(fig, "computation_time_bar.svg")
+    fig.clf()
+
+    # --- Optimality Gap Bar Chart ---
+    # There is no gap for the optimal method itself, so drop its NaN rows
+    gap_summary = summary[summary['gap'].notna()]
+
+    ax = fig.add_subplot(111)
+    sns.barplot(
+        data=gap_summary,
+        x='scenario_description',
+        y='gap',
+        hue='method',
+        palette='Set2',
+        order=scenario_order,
+        ax=ax
+    )
+    ax.set_xlabel("")  # Remove x-axis label
+    ax.set_ylabel("Relative Gap")
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.grid(axis='y', linestyle='--', alpha=0.5)
+    ax.legend_.set_title("")  # Remove legend title
+    _finish(fig, "relative_gap_bar.svg")
+    plt.close(fig)
@@ -1,7 +1,5 @@
-import pandas as pd
 import matplotlib
 matplotlib.use('TkAgg')  # <-- Fix für PyCharm
-import matplotlib.pyplot as plt
 
 def plot_shelter_coordinates(excel_path):
     """
@@ -10,16 +8,32 @@ def plot_shelter_coordinates(excel_path):
     Args:
         excel_path (str): Path to the Excel file containing the 'Coordinates' sheet.
     """
-    # Lade die Koordinaten
-    coords_df = pd.read_excel(excel_path, sheet_name='Coordinates', index_col=0)
+    # pandas/pyplot erst hier importieren, damit der reine Import des
+    # Moduls nicht die komplette Plot-/DataFrame-Maschinerie lädt
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    # Lade die Koordinaten; calamine (Rust-basierter Parser) ist deutlich
+    # schneller als openpyxl, daher falls vorhanden bevorzugen
+    try:
+        coords_df = pd.read_excel(excel_path, sheet_name='Coordinates',
+                                  index_col=0, engine='calamine')
+    except (ImportError, ValueError):
+        # read-only/data-only spart das komplette beschreibbare
+        # Workbook-Modell von openpyxl, wir lesen ja nur
+        coords_df = pd.read_excel(excel_path, sheet_name='Coordinates', index_col=0,
+                                  engine='openpyxl',
+                                  engine_kwargs={'read_only': True, 'data_only': True,
+                                                 'keep_links': False})
 
     # Trenne Depot (node 0) und Shelter
     depot = coords_df.loc[0]
     shelters = coords_df.drop(index=0)
 
-    # Erzeuge Plot
+    # Erzeuge Plot (Arrays statt Series an matplotlib übergeben)
+    xs = shelters['x'].to_numpy()
+    ys = shelters['y'].to_numpy()
     plt.figure(figsize=(8, 6))
-    plt.scatter(shelters['x'], shelters['y'], c='blue', label='Shelters', alpha=0.7)
+    plt.scatter(xs, ys, c='blue', label='Shelters', alpha=0.7)
     plt.scatter(depot['x'], depot['y'], c='red', label='Depot', marker='X', s=100)
     plt.title("Shelter and Depot Locations")
     plt.xlabel("X Coordinate")
@@ -30,7 +44,6 @@ def plot_shelter_coordinates(excel_path):
 
     # Versuche Anzeige, alternativ Speichern
     try:
-        plt.switch_backend('TkAgg')  # Wechsel auf zuverlässiges Fenster-Backend
         plt.show()
     except Exception as e:
         print("Plot display failed (likely due to PyCharm backend).")
@@ -1,13 +1,28 @@
-import pandas as pd
 import matplotlib
-matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
-import seaborn as sns
+matplotlib.use("Agg")  # plots are only saved to disk, no GUI backend needed
 import os
-from matplotlib.ticker import PercentFormatter
+
+# pandas/pyplot/seaborn are imported inside the functions: seaborn alone
+# pulls in scipy and the font cache, which is wasted work when this module
+# is merely imported or exits early on a bad path.
+
+from _eval_common import _load_results
+
+# Only these columns are ever used; naming them lets read_excel skip the
+# unused cells and the dtype map skips the type-inference pass.
+_RESULT_COLS = ['scenarioID',
+                'obj heuristic', 'obj naive',
+                'time heuristic', 'time naive']
+_RESULT_DTYPES = {'scenarioID': 'int16',
+                  'obj heuristic': 'float32', 'obj naive': 'float32',
+                  'time heuristic': 'float32', 'time naive': 'float32'}
 
 def evaluate_heuristic_experiment(results_excel_path):
-    df = pd.read_excel(results_excel_path)
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from matplotlib.ticker import PercentFormatter
+
+    df = _load_results(results_excel_path, usecols=_RESULT_COLS, dtype=_RESULT_DTYPES)
 
     # Compute relative improvements
     df['rel_improvement_obj'] = (df['obj naive'] - df['obj heuristic']) / df['obj naive']
@@ -39,7 +54,7 @@ def evaluate_heuristic_experiment(results_excel_path):
     plt.gca().yaxis.set_major_formatter(PercentFormatter(1.0))
     plt.grid(axis='y', linestyle='--', alpha=0.5)
     plt.tight_layout()
-    plt.savefig(os.path.join(plots_dir, "relative_obj_improvement.png"))
+    plt.savefig(os.path.join(plots_dir, "relative_obj_improvement.svg"))
     plt.close()
 
     # Plot: Computation Time Improvement
@@ -51,7 +66,7 @@ def evaluate_heuristic_experiment(results_excel_path):
     plt.gca().yaxis.set_major_formatter(PercentFormatter(1.0))
     plt.grid(axis='y', linestyle='--', alpha=0.5)
     plt.tight_layout()
-    plt.savefig(os.path.join(plots_dir, "relative_time_improvement.png"))
+    plt.savefig(os.path.join(plots_dir, "relative_time_improvement.svg"))
     plt.close()
 
 if __name__ == "__main__":
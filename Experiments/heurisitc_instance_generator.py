@@ -2,13 +2,86 @@ import numpy as np
 import pandas as pd
 import os
 import math
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from scipy.spatial.distance import pdist, squareform
 
-def instance_generator_comparison(num_instances=3):
+def _generate_instance(nS, seed):
+    """
+    Pure numeric kernel: samples clustered coordinates, the distance
+    matrix and the demand vector for one instance. Kept free of any
+    pandas/xlsx code so it stays a tight array-only routine.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Coordinates with medium clustering (one vectorized draw per instance
+    # instead of nS individual RNG calls)
+    k = max(3, nS // 4)
+    centers = rng.random((k, 2)) * 100
+    cluster_idx = np.arange(nS) % k
+    shelter_coords = centers[cluster_idx] + rng.normal(scale=5.0, size=(nS, 2))
+    depot = np.array([[50.0, 50.0]])
+    coords = np.vstack([depot, shelter_coords])
+
+    # pdist computes only the C(N, 2) unique pairs of the symmetric matrix;
+    # squareform mirrors them into the full (N, N) form
+    dist = squareform(pdist(coords))
+    # distances live in [0, ~150] so float32 keeps far more precision than
+    # needed and halves the memory and I/O volume of the Distance sheet
+    dist = dist.astype(np.float32, copy=False)
+    vals = rng.integers(10, 51, size=nS)
+    return coords, dist, vals
+
+def _build_frames(nS, nV, cap, base_speed, base_unload, seed):
+    """Generates one instance and assembles the four sheets as DataFrames."""
+    coords, dist, vals = _generate_instance(nS, seed)
+    demand = {i + 1: float(vals[i]) for i in range(nS)}
+    Dtot = sum(demand.values())
+    T_max = math.ceil(Dtot / (cap * nV))
+
+    params = pd.DataFrame({
+        'param': ['S_size', 'V_size', 'capacity', 'speed', 'unload_t', 'T_max'],
+        'value': [nS + 1, nV, cap, base_speed, base_unload, T_max]
+    })
+    dem_df = pd.DataFrame.from_dict(demand, orient='index', columns=['demand'])
+    dem_df.index.name = 'node_id'
+    dist_df = pd.DataFrame(dist, index=range(nS + 1), columns=range(nS + 1))
+    coords_df = pd.DataFrame(coords, columns=['x', 'y'])
+    coords_df.index.name = 'node_id'
+    return params, dem_df, dist_df, coords_df
+
+def _write_instance(args):
+    """
+    Generates and writes one instance workbook. Runs in a worker process,
+    so each task carries its own RNG seed for reproducible output.
+    """
+    scen_dir, idx, inst, nS, nV, cap, base_speed, base_unload, seed = args
+
+    params, dem_df, dist_df, coords_df = _build_frames(nS, nV, cap, base_speed, base_unload, seed)
+
+    path = os.path.join(scen_dir, f"scenario_{idx}_instance_{inst}.xlsx")
+    # xlsxwriter in constant-memory mode streams rows to disk instead of
+    # building the whole workbook in RAM like the default openpyxl engine
+    with pd.ExcelWriter(path, engine='xlsxwriter',
+                        engine_kwargs={'options': {'constant_memory': True}}) as w:
+        params.to_excel(w, sheet_name='Params', index=False)
+        dem_df.to_excel(w, sheet_name='Demand')
+        dist_df.to_excel(w, sheet_name='Distance')
+        coords_df.to_excel(w, sheet_name='Coordinates')
+    return path
+
+def instance_generator_comparison(num_instances=3, hdf5_store=False):
     """
     Generates 4 scenarios (with increasing shelter counts) × num_instances Excel files.
     Includes: Params, Demand, Distance, Coordinates.
     Shelter counts: low, medium, medium-high, high.
+    The xlsx writes are CPU-bound, so instances are generated in parallel
+    across worker processes.
+
+    With hdf5_store=True, each scenario additionally gets a consolidated
+    instances.h5 holding all of its instances in one file, amortizing the
+    per-workbook open/close cost for bulk consumers. The per-instance
+    xlsx files are still written since the experiment runner reads those.
     """
     base_speed = 60
     base_unload = 10
@@ -17,8 +90,6 @@ def instance_generator_comparison(num_instances=3):
     vehicles = 3
     capacity = 20
 
-    def d_med(n): return np.random.randint(10, 51, size=n)
-
     scenarios = [
         ('low',),
         ('med',),
@@ -31,6 +102,7 @@ def instance_generator_comparison(num_instances=3):
     os.makedirs(base, exist_ok=True)
     print(f"Created base folder: {base}")
 
+    tasks = []
     for idx, (A,) in enumerate(scenarios, 1):
         scen_dir = os.path.join(base, f"scenario_{idx}")
         os.makedirs(scen_dir, exist_ok=True)
@@ -40,39 +112,29 @@ def instance_generator_comparison(num_instances=3):
         cap = capacity
 
         for inst in range(1, num_instances + 1):
-            # Coordinates with medium clustering
-            k = max(3, nS // 4)
-            centers = np.random.rand(k, 2) * 100
-            coords = [np.random.normal(loc=centers[i % k], scale=5, size=2) for i in range(nS)]
-            depot = np.array([[50.0, 50.0]])
-            coords = np.vstack([depot, coords])
-
-            dist = np.linalg.norm(coords[:, None, :] - coords[None, :, :], axis=2)
-            vals = d_med(nS)
-            demand = {i + 1: float(vals[i]) for i in range(nS)}
-            Dtot = sum(demand.values())
-            T_max = math.ceil(Dtot / (cap * nV))
-
-            params = pd.DataFrame({
-                'param': ['S_size', 'V_size', 'capacity', 'speed', 'unload_t', 'T_max'],
-                'value': [nS + 1, nV, cap, base_speed, base_unload, T_max]
-            })
-            dem_df = pd.DataFrame.from_dict(demand, orient='index', columns=['demand'])
-            dem_df.index.name = 'node_id'
-            dist_df = pd.DataFrame(dist, index=range(nS + 1), columns=range(nS + 1))
-            coords_df = pd.DataFrame(coords, columns=['x', 'y'])
-            coords_df.index.name = 'node_id'
-
-            path = os.path.join(scen_dir, f"scenario_{idx}_instance_{inst}.xlsx")
-            with pd.ExcelWriter(path) as w:
-                params.to_excel(w, sheet_name='Params', index=False)
-                dem_df.to_excel(w, sheet_name='Demand')
-                dist_df.to_excel(w, sheet_name='Distance')
-                coords_df.to_excel(w, sheet_name='Coordinates')
-
-        print(f"  → Completed scenario {idx} with {nS} shelters")
+            seed = idx * 10000 + inst
+            tasks.append((scen_dir, idx, inst, nS, nV, cap, base_speed, base_unload, seed))
+
+    with ProcessPoolExecutor() as ex:
+        list(ex.map(_write_instance, tasks))
+
+    if hdf5_store:
+        # _generate_instance is deterministic per seed, so the arrays can be
+        # rebuilt cheaply here and batched into one store per scenario.
+        for scen_dir, idx, inst, nS, nV, cap, spd, unl, seed in tasks:
+            store_path = os.path.join(scen_dir, "instances.h5")
+            params, dem_df, dist_df, coords_df = _build_frames(nS, nV, cap, spd, unl, seed)
+            with pd.HDFStore(store_path) as store:
+                # 'fixed' format: bulk read/write without pytables indexing
+                store.put(f"inst_{inst}/params", params, format='fixed')
+                store.put(f"inst_{inst}/demand", dem_df, format='fixed')
+                store.put(f"inst_{inst}/distance", dist_df, format='fixed')
+                store.put(f"inst_{inst}/coordinates", coords_df, format='fixed')
+
+    for idx, (A,) in enumerate(scenarios, 1):
+        print(f"  → Completed scenario {idx} with {shelters[A]} shelters")
 
     print("All comparison scenarios generated.")
 
 if __name__ == "__main__":
-    instance_generator_comparison(num_instances=10)
\ No newline at end of file
+    instance_generator_comparison(num_instances=10)
@@ -2,7 +2,81 @@ import numpy as np
 import pandas as pd
 import os
 import math
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from scipy.spatial.distance import cdist
+
+
+def _make_one(args):
+    """
+    Builds and writes a single instance file. Module-level so
+    ProcessPoolExecutor can pickle it; each task gets its own seeded RNG,
+    which also makes the generated instances reproducible.
+    """
+    scen_dir, idx, inst, D, nS, nV, cap, base_speed, base_unload = args
+    rng = np.random.default_rng(inst * 100 + idx)
+
+    # --- Coordinates based on clustering level D ---
+    if D == 'low':
+        coords = rng.random((nS + 1, 2)) * 100
+    elif D in ('med', 'high'):
+        if D == 'med':
+            k = max(3, nS // 4)  # more clusters
+            scale = 5.0
+        else:
+            k = max(5, nS // 6)  # tighter & more clusters
+            scale = 2.5
+        centers = rng.random((k, 2)) * 100
+        # One RNG call for all shelters instead of a per-shelter
+        # list comprehension (each building its own 2-vector)
+        shelter_coords = centers[np.arange(nS) % k] + rng.normal(scale=scale, size=(nS, 2))
+        depot = np.array([[50.0, 50.0]])
+        coords = np.vstack([depot, shelter_coords])
+    else:
+        raise ValueError(f"Invalid clustering level: {D}")
+
+    # cdist avoids materializing the (N, N, 2) broadcast temporary
+    # that np.linalg.norm over a difference array needs
+    dist = cdist(coords, coords)
+    vals = rng.integers(10, 51, size=nS)
+    demand = {i + 1: float(vals[i]) for i in range(nS)}
+    Dtot = sum(demand.values())
+    T_max = math.ceil(Dtot / (cap * nV))
+
+    params = pd.DataFrame({
+        'param': ['S_size', 'V_size', 'capacity', 'speed', 'unload_t', 'T_max'],
+        'value': [nS + 1, nV, cap, base_speed, base_unload, T_max]
+    })
+    dem_df = pd.DataFrame.from_dict(demand, orient='index', columns=['demand'])
+    dem_df.index.name = 'node_id'
+    dist_df = pd.DataFrame(dist, index=range(nS + 1), columns=range(nS + 1))
+    coords_df = pd.DataFrame(coords, columns=['x', 'y'])
+    coords_df.index.name = 'node_id'
+
+    path = os.path.join(scen_dir, f"scenario_{idx}_instance_{inst}.xlsx")
+    # xlsxwriter in constant-memory mode streams rows straight to disk
+    # instead of building the whole workbook DOM in memory (openpyxl)
+    with pd.ExcelWriter(path, engine='xlsxwriter',
+                        engine_kwargs={'options': {'constant_memory': True}}) as w:
+        params.to_excel(w, sheet_name='Params', index=False)
+        dem_df.to_excel(w, sheet_name='Demand')
+        dist_df.to_excel(w, sheet_name='Distance')
+        coords_df.to_excel(w, sheet_name='Coordinates')
+
+    # Parquet sidecars: columnar binary, much faster to load than
+    # going through openpyxl again. The xlsx stays the canonical,
+    # human-inspectable copy; load_instance prefers the sidecars.
+    base_path = path.rsplit('.', 1)[0]
+    try:
+        params.to_parquet(base_path + "_params.parquet", index=False)
+        dem_df.to_parquet(base_path + "_demand.parquet")
+        coords_df.to_parquet(base_path + "_coords.parquet")
+    except ImportError:
+        pass  # no pyarrow/fastparquet: the xlsx alone still works
+    # The distance matrix is the big one: a raw .npy dump (tiny header,
+    # contiguous float32 blob) beats any table format for it.
+    np.save(base_path + "_dist.npy", dist.astype(np.float32))
+
 
 def instance_generator_with_coordinates(num_instances=30):
     """
@@ -12,6 +86,8 @@ def instance_generator_with_coordinates(num_instances=30):
       • Distance: full S×S matrix
       • Coordinates: node_id → x, y
     The 4th level (D) controls the clustering degree of shelter locations.
+    The instances are independent, so they are written in parallel across
+    a process pool (xlsx serialization is CPU-bound in openpyxl).
     """
     base_speed = 60
     base_unload = 10
@@ -19,7 +95,6 @@ def instance_generator_with_coordinates(num_instances=30):
     shelters = {'low': 3, 'med': 7, 'high': 9}
     vehicles = {'low': 1, 'med': 3, 'high': 5}
     capacity = {'low': 5, 'med': 20, 'high': 30}
-    def d_med(n): return np.random.randint(10, 51, size=n)
 
     scenarios = [
         ('med', 'med', 'med', 'med'),
@@ -38,6 +113,7 @@ def instance_generator_with_coordinates(num_instances=30):
     os.makedirs(base, exist_ok=True)
     print(f"Created base folder: {base}")
 
+    tasks = []
     for idx, (A, B, C, D) in enumerate(scenarios, 1):
         scen_dir = os.path.join(base, f"scenario_{idx}")
         os.makedirs(scen_dir, exist_ok=True)
@@ -47,51 +123,15 @@ def instance_generator_with_coordinates(num_instances=30):
         cap = capacity[C]
 
         for inst in range(1, num_instances + 1):
-            # --- Coordinates based on clustering level D ---
-            if D == 'low':
-                coords = np.random.rand(nS + 1, 2) * 100
-            elif D == 'med':
-                k = max(3, nS // 4)  # more clusters
-                centers = np.random.rand(k, 2) * 100
-                coords = [np.random.normal(loc=centers[i % k], scale=5, size=2) for i in range(nS)]
-                depot = np.array([[50.0, 50.0]])
-                coords = np.vstack([depot, coords])
-            elif D == 'high':
-                k = max(5, nS // 6)  # tighter & more clusters
-                centers = np.random.rand(k, 2) * 100
-                coords = [np.random.normal(loc=centers[i % k], scale=2.5, size=2) for i in range(nS)]
-                depot = np.array([[50.0, 50.0]])
-                coords = np.vstack([depot, coords])
-            else:
-                raise ValueError(f"Invalid clustering level: {D}")
-
-            dist = np.linalg.norm(coords[:, None, :] - coords[None, :, :], axis=2)
-            vals = d_med(nS)
-            demand = {i + 1: float(vals[i]) for i in range(nS)}
-            Dtot = sum(demand.values())
-            T_max = math.ceil(Dtot / (cap * nV))
-
-            params = pd.DataFrame({
-                'param': ['S_size', 'V_size', 'capacity', 'speed', 'unload_t', 'T_max'],
-                'value': [nS + 1, nV, cap, base_speed, base_unload, T_max]
-            })
-            dem_df = pd.DataFrame.from_dict(demand, orient='index', columns=['demand'])
-            dem_df.index.name = 'node_id'
-            dist_df = pd.DataFrame(dist, index=range(nS + 1), columns=range(nS + 1))
-            coords_df = pd.DataFrame(coords, columns=['x', 'y'])
-            coords_df.index.name = 'node_id'
-
-            path = os.path.join(scen_dir, f"scenario_{idx}_instance_{inst}.xlsx")
-            with pd.ExcelWriter(path) as w:
-                params.to_excel(w, sheet_name='Params', index=False)
-                dem_df.to_excel(w, sheet_name='Demand')
-                dist_df.to_excel(w, sheet_name='Distance')
-                coords_df.to_excel(w, sheet_name='Coordinates')
+            tasks.append((scen_dir, idx, inst, D, nS, nV, cap, base_speed, base_unload))
 
-        print(f"  → Completed scenario {idx} ({A},{B},{C},{D})")
+    with ProcessPoolExecutor() as ex:
+        list(ex.map(_make_one, tasks, chunksize=4))
 
+    for idx, (A, B, C, D) in enumerate(scenarios, 1):
+        print(f"  → Completed scenario {idx} ({A},{B},{C},{D})")
     print("All scenarios generated.")
 
 # call the generator
 if __name__ == "__main__":
-    instance_generator_with_coordinates(num_instances=3)
\ No newline at end of file
+    instance_generator_with_coordinates(num_instances=3)
@@ -1,11 +1,94 @@
+import csv
+import hashlib
 import os
+import struct
+import numpy as np
 import pandas as pd
 import time
+from concurrent.futures import ProcessPoolExecutor
 from heuristic_algorithm import nearest_neighbor_heuristic
 from naive_algorithm import naive_single_delivery
-from opitmal_algorithm_speed_up import solve_routing
+from opitmal_algorithm_speed_up import solve_routing, load_instance
 
-def run_experiments(path_to_folder, include_heuristic=True, include_naive_heuristic=True, include_optimal=True):
+# one Gurobi environment per worker process, created lazily on the first
+# optimal solve: the license handshake and env startup are paid once per
+# worker instead of once per instance
+_GUROBI_ENV = None
+
+
+def _get_gurobi_env():
+    global _GUROBI_ENV
+    if _GUROBI_ENV is None:
+        import gurobipy as gp
+        _GUROBI_ENV = gp.Env()
+    return _GUROBI_ENV
+
+
+def _run_one(args):
+    """
+    Runs the selected algorithms on a single instance file. Module-level so
+    ProcessPoolExecutor can pickle it; returns the result row dict.
+    """
+    (excel_path, scenario_id, scenario_description, instance_id,
+     include_heuristic, include_naive_heuristic, include_optimal,
+     gurobi_params) = args
+
+    # Load data: the solver's cached loader prefers the binary
+    # sidecars (.npy / parquet) next to the xlsx and memoizes per
+    # (path, mtime), so repeated runs over the same instances skip
+    # the openpyxl parse entirely.
+    S, V, distance, demand, capacity, speed, unload_t = load_instance(excel_path)
+    V_size = len(V)
+
+    # Initialize values
+    obj_heuristic = time_heuristic = None
+    obj_naive = time_naive = None
+    obj_optimal = time_optimal = gap_optimal = None
+
+    # Nearest Neighbor Heuristic
+    heuristic_routes = None
+    if include_heuristic:
+        start = time.time()
+        obj_heuristic, computation_time , heuristic_routes = nearest_neighbor_heuristic(S, V_size, distance, demand, capacity, speed, unload_t)
+        #time_heuristic = time.time() - start
+        time_heuristic = computation_time
+        print(f"[✓] NN Heuristic finished: Scenario {scenario_id}, Instance {instance_id}")
+
+    # Naive Heuristic (returns only obj)
+    if include_naive_heuristic:
+        start = time.time()
+        obj_naive, _ = naive_single_delivery(S, range(V_size), distance, demand, capacity, speed, unload_t)
+        time_naive = time.time() - start
+        print(f"[✓] Naive Heuristic finished: Scenario {scenario_id}, Instance {instance_id}")
+
+    # Optimal Solver
+    if include_optimal:
+        start = time.time()
+        # the NN routes are feasible for the MIP, so hand them over
+        # as a MIP start: an immediate incumbent instead of waiting
+        # for Gurobi's own heuristics to find one
+        obj_optimal, _, gap_optimal = solve_routing(S, V, distance, demand, capacity, speed, unload_t,
+                                                    warm_start_routes=heuristic_routes,
+                                                    params=gurobi_params,
+                                                    env=_get_gurobi_env())
+        time_optimal = time.time() - start
+        print(f"[✓] Optimal Solver finished: Scenario {scenario_id}, Instance {instance_id}")
+
+    return {
+        "scenarioID": scenario_id,
+        "scenario_description": scenario_description,
+        "instanceID": instance_id,
+        "obj heuristic": obj_heuristic,
+        "time heuristic": time_heuristic,
+        "obj naive": obj_naive,
+        "time naive": time_naive,
+        "obj optimal": obj_optimal,
+        "time optimal": time_optimal,
+        "mip gap optimal": gap_optimal,
+    }
+
+
+def run_experiments(path_to_folder, include_heuristic=True, include_naive_heuristic=True, include_optimal=True, n_jobs=4):
     """
     Runs the selected algorithms on all Excel instance files in the given folder.
 
@@ -14,6 +97,9 @@ def run_experiments(path_to_folder, include_heuristic=True, include_naive_heuris
         include_heuristic (bool): Whether to run the nearest neighbor heuristic.
         include_naive_heuristic (bool): Whether to run the naive heuristic.
         include_optimal (bool): Whether to run the optimal solver.
+        n_jobs (int): Number of instances solved in parallel. Gurobi's
+            thread count is split across the workers, since its parallel
+            speedup flattens out past a few threads on these small MIPs.
     """
     description_map = {
         1: "baseline",
@@ -27,8 +113,18 @@ def run_experiments(path_to_folder, include_heuristic=True, include_naive_heuris
         9: "high clustering",
     }
 
-    results = []
+    # Per-scenario Gurobi overrides, applied on top of the solver's
+    # defaults: the dense scenarios benefit from heavier root cutting,
+    # the vehicle-heavy one from aggressive presolve.
+    gurobi_param_map = {
+        3: {"Cuts": 3, "Heuristics": 0.1},   # many shelters
+        5: {"Presolve": 2},                  # many vehicles
+    }
+
+    n_jobs = max(1, int(n_jobs))
+    threads_per_job = max(1, (os.cpu_count() or 1) // n_jobs)
 
+    tasks = []
     for scenario_name in sorted(os.listdir(path_to_folder)):
         scenario_path = os.path.join(path_to_folder, scenario_name)
         if not os.path.isdir(scenario_path):
@@ -44,62 +140,66 @@ def run_experiments(path_to_folder, include_heuristic=True, include_naive_heuris
             instance_id = int(file_name.split("_")[-1].split(".")[0])
             excel_path = os.path.join(scenario_path, file_name)
 
-            # Load data
-            params_df = pd.read_excel(excel_path, sheet_name="Params")
-            demand_df = pd.read_excel(excel_path, sheet_name="Demand", index_col=0)
-            dist_df = pd.read_excel(excel_path, sheet_name="Distance", index_col=0)
-
-            p = params_df.set_index("param")["value"].to_dict()
-            S_size = int(p["S_size"])
-            V_size = int(p["V_size"])
-            capacity = float(p["capacity"])
-            speed = float(p["speed"])
-            unload_t = float(p["unload_t"])
-
-            S = range(S_size)
-            V = range(V_size)
-            demand = {int(i): float(demand_df.loc[i, "demand"]) for i in demand_df.index}
-            distance = {(int(i), int(j)): float(dist_df.loc[i, j]) for i in dist_df.index for j in dist_df.columns}
-
-            # Initialize values
-            obj_heuristic = time_heuristic = None
-            obj_naive = time_naive = None
-            obj_optimal = time_optimal = None
-
-            # Nearest Neighbor Heuristic
-            if include_heuristic:
-                start = time.time()
-                obj_heuristic, computation_time , _ = nearest_neighbor_heuristic(S, V_size, distance, demand, capacity, speed, unload_t)
-                #time_heuristic = time.time() - start
-                time_heuristic = computation_time
-                print(f"[✓] NN Heuristic finished: Scenario {scenario_id}, Instance {instance_id}")
-
-            # Naive Heuristic (returns only obj)
-            if include_naive_heuristic:
-                start = time.time()
-                obj_naive, _ = naive_single_delivery(S, range(V_size), distance, demand, capacity, speed, unload_t)
-                time_naive = time.time() - start
-                print(f"[✓] Naive Heuristic finished: Scenario {scenario_id}, Instance {instance_id}")
-
-            # Optimal Solver
-            if include_optimal:
-                start = time.time()
-                obj_optimal, _ = solve_routing(S, V, distance, demand, capacity, speed, unload_t)
-                time_optimal = time.time() - start
-                print(f"[✓] Optimal Solver finished: Scenario {scenario_id}, Instance {instance_id}")
-
-            # Store results
-            results.append({
-                "scenarioID": scenario_id,
-                "scenario_description": scenario_description,
-                "instanceID": instance_id,
-                "obj heuristic": obj_heuristic,
-                "time heuristic": time_heuristic,
-                "obj naive": obj_naive,
-                "time naive": time_naive,
-                "obj optimal": obj_optimal,
-                "time optimal": time_optimal,
-            })
+            gurobi_params = dict(gurobi_param_map.get(scenario_id, {}))
+            gurobi_params.setdefault("Threads", threads_per_job)
+            tasks.append((excel_path, scenario_id, scenario_description, instance_id,
+                          include_heuristic, include_naive_heuristic, include_optimal,
+                          gurobi_params))
+
+    # Byte-identical instances (same distance matrix, demand and
+    # parameters) are solved once; duplicates just reuse the result row.
+    # Hashing reads through the cached loader, so with sidecars present
+    # the pre-pass is a handful of binary reads.
+    unique_tasks = []
+    task_to_unique = []
+    seen = {}
+    for task in tasks:
+        S, V, distance, demand, capacity, speed, unload_t = load_instance(task[0])
+        dem_bytes = np.array(sorted(demand.items()), dtype=np.float64).tobytes()
+        key = hashlib.blake2b(
+            np.ascontiguousarray(distance).tobytes() + dem_bytes +
+            struct.pack("dddi", capacity, speed, unload_t, len(V))
+        ).digest()
+        if key not in seen:
+            seen[key] = len(unique_tasks)
+            unique_tasks.append(task)
+        task_to_unique.append(seen[key])
+
+    # The instances are independent, so they are solved in parallel across
+    # a process pool; ex.map preserves the task order in the results.
+    # Each finished row is appended to a CSV right away, so a crashed or
+    # interrupted run keeps everything solved so far.
+    fieldnames = ["scenarioID", "scenario_description", "instanceID",
+                  "obj heuristic", "time heuristic",
+                  "obj naive", "time naive",
+                  "obj optimal", "time optimal", "mip gap optimal"]
+    csv_path = os.path.join(path_to_folder, "experiment_results_incremental.csv")
+    unique_results = []
+    with open(csv_path, "w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=fieldnames)
+        writer.writeheader()
+        if n_jobs > 1:
+            with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+                row_iter = ex.map(_run_one, unique_tasks)
+                for row in row_iter:
+                    unique_results.append(row)
+                    writer.writerow(row)
+                    fh.flush()
+        else:
+            for task in unique_tasks:
+                row = _run_one(task)
+                unique_results.append(row)
+                writer.writerow(row)
+                fh.flush()
+
+    # expand back to one row per instance file, re-labeled per task
+    results = []
+    for task, uidx in zip(tasks, task_to_unique):
+        row = dict(unique_results[uidx])
+        row["scenarioID"] = task[1]
+        row["scenario_description"] = task[2]
+        row["instanceID"] = task[3]
+        results.append(row)
 
     results_df = pd.DataFrame(results)
     output_path = os.path.join(path_to_folder, "experiment_results.xlsx")
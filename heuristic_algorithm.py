@@ -1,14 +1,151 @@
-import math
+import logging
 import time
-import pandas as pd
+import numpy as np
+from instance_io import load_instance as _load_instance_io
 import matplotlib
 matplotlib.use('TkAgg')  # <-- Fix für PyCharm
 import matplotlib.pyplot as plt  # For bar chart
 
 from path_mapping import plot_shelter_trips
 
+log = logging.getLogger(__name__)
 
-def nearest_neighbor_heuristic(S, V_count, distance_matrix, demand_dict, capacity, speed, unload_t_per_unit):
+
+def setup_logging(level=logging.DEBUG):
+    """Route the heuristic's diagnostic log to stdout (plain messages)."""
+    logging.basicConfig(level=level, format="%(message)s")
+
+
+# Numba is optional: with it the routing kernel below is JIT-compiled to
+# native code, without it the same function runs as plain Python/NumPy.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def _decorate(func):
+            return func
+        return _decorate
+
+
+@njit(cache=True)
+def route_cost(route, dist_arr):
+    """
+    Total length of a node sequence on the dense distance matrix. Tiny,
+    but it sits in the innermost loop of any route evaluation, so it is
+    compiled like the construction kernel (route as an int array).
+    """
+    s = 0.0
+    for k in range(len(route) - 1):
+        s += dist_arr[route[k], route[k + 1]]
+    return s
+
+
+@njit(cache=True)
+def _build_routes(T, nn_order, demand, capacity, unload_t):
+    """
+    Nearest-neighbor trip construction kernel. Pure array code (no dicts,
+    no prints) so Numba can compile it; returns everything the caller
+    needs to rebuild the route lists and log output.
+
+    T is the travel-time matrix (minutes), precomputed as D * (60/speed):
+    travel time is a monotone transform of distance, so T serves both for
+    neighbor selection and for the time accumulation, with no division or
+    speed scaling left in the loop.
+
+    nn_order is np.argsort(T, axis=1): with the neighbors of each node
+    presorted once up front, every step only scans that row until the
+    first still-unvisited node instead of re-comparing all distances.
+
+    Returns:
+        routes (int32 (max_trips, n+2)): node sequences, -1-padded.
+        lengths (int32 (max_trips,)): used length of each route row.
+        delivered ((max_trips, n+2)): units unloaded at each route position.
+        trip_travel ((max_trips,)): travel time per trip in minutes.
+        trip_unload ((max_trips,)): unload time per trip in minutes.
+        n_trips (int): number of completed trips.
+        remaining ((n,)): demand still unserved per node.
+    """
+    n = T.shape[0]
+    remaining = demand.copy()
+    unvisited = remaining > 1e-6
+    unvisited[0] = False
+    n_open = 0
+    for j in range(n):
+        if unvisited[j]:
+            n_open += 1
+
+    # Every trip except possibly the last leaves the depot full, so
+    # ceil(total_demand / capacity) rows carry the demand; n + 1 extra
+    # rows cover trips cut short by fully serving their last customer or
+    # by unreachable remainders. The row length n+2 holds because within
+    # one trip a customer is visited at most once.
+    max_trips = n + int(np.ceil(remaining.sum() / capacity)) + 1
+    routes = np.full((max_trips, n + 2), -1, np.int32)
+    lengths = np.zeros(max_trips, np.int32)
+    delivered = np.zeros((max_trips, n + 2))
+    trip_travel = np.zeros(max_trips)
+    trip_unload = np.zeros(max_trips)
+
+    n_trips = 0
+    while n_open > 0:
+        cur = 0
+        load = 0.0
+        routes[n_trips, 0] = 0
+        pos = 1
+
+        while True:
+            best = -1
+            if load < capacity - 1e-6:
+                # First still-unvisited node in distance order; an inf
+                # distance there means nothing reachable is left.
+                for k in range(n):
+                    j = nn_order[cur, k]
+                    if j != 0 and unvisited[j]:
+                        if T[cur, j] != np.inf:
+                            best = j
+                        break
+            if best < 0:
+                break
+
+            trip_travel[n_trips] += T[cur, best]
+            cur = best
+
+            unloaded = capacity - load
+            if remaining[cur] < unloaded:
+                unloaded = remaining[cur]
+            load += unloaded
+            remaining[cur] -= unloaded
+            trip_unload[n_trips] += unload_t * unloaded
+
+            routes[n_trips, pos] = cur
+            delivered[n_trips, pos] = unloaded
+            pos += 1
+
+            if remaining[cur] <= 1e-6:
+                unvisited[cur] = False
+                n_open -= 1
+            if load >= capacity - 1e-6 or n_open == 0:
+                break
+
+        if cur != 0:
+            trip_travel[n_trips] += T[cur, 0]
+            routes[n_trips, pos] = 0
+            pos += 1
+        lengths[n_trips] = pos
+
+        if pos > 2:
+            n_trips += 1
+        else:
+            # Depot-only trip: no reachable customer, stop to avoid spinning
+            break
+
+    return routes, lengths, delivered, trip_travel, trip_unload, n_trips, remaining
+
+
+def nearest_neighbor_heuristic(S, V_count, distance_matrix, demand_dict, capacity, speed, unload_t_per_unit,
+                               verbose=False, show_chart=False):
     t0 = time.time()
     """
     Implements a Nearest Neighbor heuristic for the Vehicle Routing Problem.
@@ -19,13 +156,18 @@ def nearest_neighbor_heuristic(S, V_count, distance_matrix, demand_dict, capacit
         S (range or list): Set of all nodes, including the depot (assumed to be 0).
         V_count (int or range): Number of available physical vehicles (must be > 0). 
                                  In current usage, this is passed as range(V_size).
-        distance_matrix (dict): Dictionary where keys are (from_node, to_node) tuples
-                                and values are distances.
+        distance_matrix (np.ndarray or dict): Dense (|S|, |S|) matrix of distances,
+                                or a legacy dict keyed by (from_node, to_node) tuples.
         demand_dict (dict): Dictionary where keys are customer nodes and values are their demands.
                             Node 0 (depot) should not be in demand_dict or have 0 demand.
         capacity (float): Capacity of each vehicle.
         speed (float): Speed of vehicles (distance unit per hour).
         unload_t_per_unit (float): Time in minutes to unload one unit of demand.
+        verbose (bool): When True, replay the per-visit/per-trip log on stdout.
+                        Off by default: the print formatting and stdout flushes
+                        dominate runtime on larger instances.
+        show_chart (bool): When True, run the (interactive) per-vehicle trip
+                           time chart block after solving.
 
     Returns:
         tuple: (total_objective_value, comp_time)
@@ -33,145 +175,142 @@ def nearest_neighbor_heuristic(S, V_count, distance_matrix, demand_dict, capacit
                - comp_time: Computation time for the heuristic.
     """
 
-    # --- Helper function to calculate travel time ---
-    def get_travel_time(node1, node2):
-        dist = distance_matrix.get((node1, node2), float('inf'))
-        if dist == float('inf'):
-            # This warning can be noisy if called many times during chart generation
-            # For chart generation, we might assume valid routes from heuristic output
-            # print(f"Warning: No direct distance found in distance_matrix for ({node1}, {node2}). Assuming unreachable.")
-            pass  # Suppress warning during chart's recalculation, rely on heuristic's earlier warnings
-        return (dist / speed) * 60  # Time in minutes
-
-    # --- Initialization ---
-    customers = [node for node in S if node != 0 and node in demand_dict and demand_dict[node] > 1e-6]
-    unvisited_customers = set(customers)
-    remaining_demand = demand_dict.copy()
-
-    routes = []
-    total_travel_time = 0  # This is the grand total travel time for the objective
-    total_unload_time = 0
-
-    trips_made_count = 0
-
-    # --- Main loop: Continue until all customers are visited ---
-    while unvisited_customers:
-        trips_made_count += 1
+    # --- Normalize the distance input to a dense NumPy matrix ---
+    # A 2-D array turns every (i, j) lookup in the hot loop into a C-level
+    # index instead of a tuple allocation + dict hash. The dict form is
+    # still accepted for older callers and densified once up front.
+    # float32 halves the bandwidth of the row scans and the nn_order
+    # table's cache footprint; ~7 significant digits is far more than the
+    # [0, 100] coordinate range needs. Totals stay float64 below.
+    n_nodes = len(S)
+    if isinstance(distance_matrix, dict):
+        D = np.full((n_nodes, n_nodes), np.inf, dtype=np.float32)
+        for (i, j), d in distance_matrix.items():
+            D[i, j] = d
+    else:
+        D = np.asarray(distance_matrix, dtype=np.float32)
 
-        current_route = [0]
-        current_load = 0
-        current_location = 0
+    # --- Travel-time matrix ---
+    # The division and speed scaling happen once for the whole matrix;
+    # every later "time" query — kernel, chart, replay — is a plain index.
+    T = D * np.float32(60.0 / speed)
 
-        route_travel_time = 0  # Travel time for the current trip being built
-        route_unload_time = 0
+    def get_travel_time(node1, node2):
+        return T[node1, node2]  # Time in minutes (inf where unreachable)
 
-        num_physical_vehicles_for_print = 0
-        if isinstance(V_count, range):
+    # --- Initialization ---
+    # Dense demand array for the kernel, filled with one fancy-indexed
+    # assignment instead of a per-node Python loop; the depot slot is
+    # zeroed so the kernel's demand > 1e-6 mask is the customer filter.
+    demand_arr = np.zeros(n_nodes, dtype=np.float32)
+    if demand_dict:
+        nodes = np.fromiter(demand_dict.keys(), dtype=np.int64, count=len(demand_dict))
+        values = np.fromiter(demand_dict.values(), dtype=np.float64, count=len(demand_dict))
+        # some files (e.g. real_data.xlsx) list demand ids beyond the
+        # distance matrix; drop them like the old `for i in S` loop did
+        # instead of raising IndexError on the fancy assignment
+        keep = (nodes >= 0) & (nodes < n_nodes)
+        demand_arr[nodes[keep]] = values[keep]
+    demand_arr[0] = 0.0
+
+    num_physical_vehicles_for_print = 0
+    if isinstance(V_count, range):
+        num_physical_vehicles_for_print = len(V_count)
+    elif isinstance(V_count, int):
+        num_physical_vehicles_for_print = V_count
+    else:
+        try:
             num_physical_vehicles_for_print = len(V_count)
-        elif isinstance(V_count, int):
+        except:
             num_physical_vehicles_for_print = V_count
-        else:
-            try:
-                num_physical_vehicles_for_print = len(V_count)
-            except:
-                num_physical_vehicles_for_print = V_count
-
-        print(
-            f"\nStarting Trip {trips_made_count} from depot (using one of {num_physical_vehicles_for_print} reusable vehicles).")
-
-        while True:
-            best_next_customer = None
-            min_distance_to_next = float('inf')
-
-            for customer_node in unvisited_customers:
-                if remaining_demand.get(customer_node, 0) > 1e-6:
-                    dist = distance_matrix.get((current_location, customer_node), float('inf'))
-
-                    if dist < min_distance_to_next:
-                        if current_load < capacity - 1e-6:
-                            min_distance_to_next = dist
-                            best_next_customer = customer_node
-
-            if best_next_customer is not None:
-                # Use a local variable for this segment's travel time to add to route_travel_time
-                segment_travel_time = get_travel_time(current_location, best_next_customer)
-                route_travel_time += segment_travel_time
-                # total_travel_time is the grand total, accumulated here
-                # total_travel_time += segment_travel_time # This was in original, keep it for objective function
-
-                current_location = best_next_customer
-                current_route.append(current_location)
-
-                can_unload = capacity - current_load
-                demand_at_customer = remaining_demand[current_location]
-                unloaded_amount = min(can_unload, demand_at_customer)
 
+    # --- Main loop, moved into the array kernel ---
+    # All trip construction happens in _build_routes (JIT-compiled when
+    # Numba is available); the loop below only replays its output to keep
+    # the familiar per-visit log and build the Python route lists.
+    # One O(n^2 log n) sort replaces the per-step distance comparisons
+    # across all trips (the depot row alone is rescanned once per trip).
+    nn_order = np.argsort(T, axis=1).astype(np.int32)
+
+    (route_arr, route_lengths, delivered_arr,
+     trip_travel, trip_unload, n_trips, remaining_arr) = _build_routes(
+        T, nn_order, demand_arr, float(capacity), float(unload_t_per_unit))
+
+    routes = [[int(node) for node in route_arr[t, :int(route_lengths[t])]]
+              for t in range(n_trips)]
+    total_travel_time = float(trip_travel[:n_trips].sum())
+    total_unload_time = float(trip_unload[:n_trips].sum())
+    trips_made_count = n_trips
+
+    if verbose and not logging.getLogger().hasHandlers():
+        setup_logging()  # verbose standalone runs still get their log
+
+    if verbose and log.isEnabledFor(logging.DEBUG):
+        # Replay the kernel output to reproduce the per-visit log; skipped
+        # entirely in the default quiet mode. %-style args keep the float
+        # formatting lazy — no string is built for suppressed records.
+        replay_remaining = demand_arr.copy()
+        replay_open = int(np.count_nonzero(replay_remaining > 1e-6))
+
+        for t in range(n_trips):
+            log.debug("\nStarting Trip %d from depot (using one of %s reusable vehicles).",
+                      t + 1, num_physical_vehicles_for_print)
+
+            current_route = routes[t]
+            current_load = 0.0
+
+            for pos in range(1, len(current_route)):
+                current_location = current_route[pos]
+                if current_location == 0:
+                    continue
+                unloaded_amount = float(delivered_arr[t, pos])
                 current_load += unloaded_amount
-                remaining_demand[current_location] -= unloaded_amount
+                replay_remaining[current_location] -= unloaded_amount
 
-                unload_for_customer_time = unload_t_per_unit * unloaded_amount
-                route_unload_time += unload_for_customer_time
-                # total_unload_time += unload_for_customer_time # This was in original, keep it
+                log.debug("  Visited %d. Delivered: %.2f. Current load: %.2f/%s. "
+                          "Remaining demand for %d: %.2f",
+                          current_location, unloaded_amount, current_load, capacity,
+                          current_location, replay_remaining[current_location])
 
-                print(f"  Visited {current_location}. Delivered: {unloaded_amount:.2f}. "
-                      f"Current load: {current_load:.2f}/{capacity}. "
-                      f"Remaining demand for {current_location}: {remaining_demand[current_location]:.2f}")
+                if replay_remaining[current_location] <= 1e-6:
+                    replay_open -= 1
+                    log.debug("  Customer %d fully served.", current_location)
 
-                if remaining_demand[current_location] <= 1e-6:
-                    unvisited_customers.remove(current_location)
-                    print(f"  Customer {current_location} fully served.")
+            if current_load >= capacity - 1e-6 or replay_open == 0:
+                log.debug("  Vehicle capacity reached or all customers globally served for this trip leg.")
 
-                if current_load >= capacity - 1e-6 or not unvisited_customers:
-                    print(f"  Vehicle capacity reached or all customers globally served for this trip leg.")
-                    break
-            else:
-                print(
-                    f"  No suitable next customer for this trip from {current_location} (check capacity/reachability/unvisited status).")
-                break
+            log.debug("Trip %d completed: %s", t + 1, current_route)
+            log.debug("  Trip travel time: %.2f min, Trip unload time: %.2f min",
+                      trip_travel[t], trip_unload[t])
 
-        if current_location != 0:
-            segment_travel_time_to_depot = get_travel_time(current_location, 0)
-            route_travel_time += segment_travel_time_to_depot
-            # total_travel_time += segment_travel_time_to_depot # Original accumulation
-            current_route.append(0)
-
-        # Accumulate total travel and unload times for the objective function from completed trips
-        if len(current_route) > 2:
-            routes.append(current_route)
-            total_travel_time += route_travel_time  # Accumulate this trip's travel time to grand total
-            total_unload_time += route_unload_time  # Accumulate this trip's unload time to grand total
-            print(f"Trip {trips_made_count} completed: {current_route}")
-            print(f"  Trip travel time: {route_travel_time:.2f} min, Trip unload time: {route_unload_time:.2f} min")
-        elif len(current_route) <= 2 and current_location == 0:
-            print(f"Trip {trips_made_count}: No customers served (stayed at depot or empty trip).")
-
-        if not unvisited_customers:
-            print("\nAll customers have been served.")
-            break
+        if replay_open == 0:
+            log.debug("\nAll customers have been served.")
 
-            # --- After the main loop ---
-    if unvisited_customers:
-        print(f"\nHeuristic finished. Some customers may remain unvisited due to reachability/logic issues.")
-        print(f"Unvisited customers with remaining demand:")
-        for customer_node in sorted(list(unvisited_customers)):
-            if remaining_demand.get(customer_node, 0) > 1e-6:
-                print(f"  Customer {customer_node}: Remaining Demand {remaining_demand[customer_node]:.2f}")
+    # --- After the main loop ---
+    unserved = np.flatnonzero(remaining_arr > 1e-6)
+    if unserved.size:
+        log.warning("Heuristic finished. Some customers may remain unvisited due to reachability/logic issues.")
+        log.warning("Unvisited customers with remaining demand:")
+        for customer_node in unserved:
+            log.warning("  Customer %d: Remaining Demand %.2f",
+                        customer_node, remaining_arr[customer_node])
 
     # total_objective_value is calculated based on the grand total_travel_time and total_unload_time
     total_objective_value = total_travel_time + total_unload_time
     comp_time = time.time() - t0
 
-    print("\n--- Heuristic Results ---")
-    actual_num_vehicles = V_count
-    if isinstance(V_count, range):
-        actual_num_vehicles = len(V_count)
-    print(f"Fleet Size (V_count interpreted as): {actual_num_vehicles} reusable vehicles.")
-    print(f"Routes (all trips): {routes}")
-    print(f"Total Trips Made: {trips_made_count}")
-    print(f"Total Travel Time (Overall): {total_travel_time:.2f} minutes")
-    print(f"Total Unload Time (Overall): {total_unload_time:.2f} minutes")
-    print(f"Total Objective Value (Travel + Unload): {total_objective_value:.2f}")
-    print(f"Computation Time: {comp_time:.4f} seconds")
+    if verbose:
+        log.debug("\n--- Heuristic Results ---")
+        actual_num_vehicles = V_count
+        if isinstance(V_count, range):
+            actual_num_vehicles = len(V_count)
+        log.debug("Fleet Size (V_count interpreted as): %s reusable vehicles.", actual_num_vehicles)
+        log.debug("Routes (all trips): %s", routes)
+        log.debug("Total Trips Made: %d", trips_made_count)
+        log.debug("Total Travel Time (Overall): %.2f minutes", total_travel_time)
+        log.debug("Total Unload Time (Overall): %.2f minutes", total_unload_time)
+        log.debug("Total Objective Value (Travel + Unload): %.2f", total_objective_value)
+        log.debug("Computation Time: %.4f seconds", comp_time)
 
     # --- Code for dictionary output for vehicle 1 to 5 ---
     num_physical_vehicles = 0
@@ -203,34 +342,38 @@ def nearest_neighbor_heuristic(S, V_count, distance_matrix, demand_dict, capacit
         target_vehicle_key = f"vehicle_{i}"
         output_vehicle_routes_for_1_to_5[target_vehicle_key] = vehicle_trip_assignments.get(target_vehicle_key, [])
 
-    print("\n--- Route Assignments for Vehicles 1-5 (Node Sequences) ---")
-    for i in range(1, 6):
-        key = f"vehicle_{i}"
-        print(f"{key}: {output_vehicle_routes_for_1_to_5[key]}")
+    if verbose:
+        log.debug("\n--- Route Assignments for Vehicles 1-5 (Node Sequences) ---")
+        for i in range(1, 6):
+            key = f"vehicle_{i}"
+            log.debug("%s: %s", key, output_vehicle_routes_for_1_to_5[key])
     # --- End code for dictionary output ---
 
+    if show_chart:
+        route_times = [float(trip_travel[t]) for t in range(n_trips)]
+        _show_trip_chart(output_vehicle_routes_for_1_to_5, route_times, num_physical_vehicles)
+
+    return total_objective_value, comp_time, vehicle_trip_assignments
+
+
+def _show_trip_chart(output_vehicle_routes_for_1_to_5, route_times, num_physical_vehicles):
     try:
         vehicle_ids_for_chart = list(output_vehicle_routes_for_1_to_5.keys())
 
-        # Data preparation for individual trip times and total times per vehicle
+        # Per-trip travel times were already accumulated during route
+        # construction; trips go round-robin to vehicles, so vehicle i
+        # owns trips i-1, i-1+V, i-1+2V, ... — no segment re-walk needed.
         vehicle_individual_trip_times = {}
         vehicle_total_times_for_ylim_and_text = {}
 
-        for vehicle_id in vehicle_ids_for_chart:
-            vehicle_routes_nodes = output_vehicle_routes_for_1_to_5[vehicle_id]
-            list_of_single_trip_times = []
-            current_vehicle_total_for_this_vehicle = 0.0
-            for trip_node_sequence in vehicle_routes_nodes:
-                single_trip_travel_time = 0.0
-                if len(trip_node_sequence) > 1:
-                    for i_segment in range(len(trip_node_sequence) - 1):
-                        node_from = trip_node_sequence[i_segment]
-                        node_to = trip_node_sequence[i_segment + 1]
-                        single_trip_travel_time += get_travel_time(node_from, node_to)
-                list_of_single_trip_times.append(single_trip_travel_time)
-                current_vehicle_total_for_this_vehicle += single_trip_travel_time
+        for v_idx, vehicle_id in enumerate(vehicle_ids_for_chart, 1):
+            if num_physical_vehicles > 0 and v_idx <= num_physical_vehicles:
+                list_of_single_trip_times = [route_times[t]
+                                             for t in range(v_idx - 1, len(route_times), num_physical_vehicles)]
+            else:
+                list_of_single_trip_times = []
             vehicle_individual_trip_times[vehicle_id] = list_of_single_trip_times
-            vehicle_total_times_for_ylim_and_text[vehicle_id] = current_vehicle_total_for_this_vehicle
+            vehicle_total_times_for_ylim_and_text[vehicle_id] = sum(list_of_single_trip_times)
 
         # Check if there's anything to plot
         all_plottable_trip_times = [
@@ -303,50 +446,22 @@ def nearest_neighbor_heuristic(S, V_count, distance_matrix, demand_dict, capacit
         print(f"\nAn error occurred during stacked bar chart generation: {e}. Skipping chart.")
         # --- END MODIFIED CODE ---
 
-    return total_objective_value, comp_time, vehicle_trip_assignments
+
 def load_instance(path):
     """
-    Reads an Excel file at `path` with sheets:
-      • Params   (cols: param, value)
-      • Demand   (index=node_id, col=demand)
-      • Distance (square matrix of size S×S)
+    Reads an instance file at `path` through the canonical cached loader
+    in instance_io. float32 is plenty for coordinates in [0, 100] and
+    halves the matrix footprint for the scan-heavy heuristic.
     Returns:
-      S, V, distance_dict, demand_dict, capacity, speed, unload_t
+      S, V, distance_ndarray, demand_dict, capacity, speed, unload_t
     """
-    # read sheets
-    params_df = pd.read_excel(path, sheet_name="Params")
-    demand_df = pd.read_excel(path, sheet_name="Demand", index_col=0)
-    dist_df = pd.read_excel(path, sheet_name="Distance", index_col=0)
-
-    # parse params
-    p = params_df.set_index("param")["value"].to_dict()
-    S_size = int(p["S_size"])
-    V_size = int(p["V_size"])
-    capacity = float(p["capacity"])
-    speed = float(p["speed"])
-    unload_t = float(p["unload_t"])
-
-    # build sets
-    S = range(S_size)
-    V = range(V_size)
-
-    # build demand dict
-    demand = {int(i): float(demand_df.loc[i, "demand"])
-              for i in demand_df.index}
-
-    # build distance dict
-    distance = {
-        (int(i), int(j)): float(dist_df.loc[i, j])
-        for i in dist_df.index for j in dist_df.columns
-    }
-
-    return S, V, distance, demand, capacity, speed, unload_t
+    return _load_instance_io(path, dtype=np.float32)
 
 
 if __name__ == "__main__":
     try:
         S_nodes, V_vehicles_range, distances, demands, cap, spd, unload_time_per_unit = load_instance("real_data.xlsx")
-        total_objective_value, comp_time, vehicle_trip_assignments = nearest_neighbor_heuristic(S_nodes, V_vehicles_range, distances, demands, cap, spd, unload_time_per_unit)
+        total_objective_value, comp_time, vehicle_trip_assignments = nearest_neighbor_heuristic(S_nodes, V_vehicles_range, distances, demands, cap, spd, unload_time_per_unit, verbose=True)
     except FileNotFoundError:
         print("Error: 'real_data.xlsx' not found. Please ensure the file exists in the correct location.")
     except ImportError:
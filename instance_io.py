@@ -0,0 +1,202 @@
+import importlib.util
+import os
+from functools import lru_cache
+from typing import NamedTuple
+import numpy as np
+from openpyxl import load_workbook
+
+
+class Instance(NamedTuple):
+    """
+    Parsed instance record. A NamedTuple, so existing
+    `S, V, distance, demand, capacity, speed, unload_t = load_instance(...)`
+    unpacking keeps working while new code can use attribute access
+    (`inst.distance[i, j]`) without re-counting tuple positions.
+    """
+    S: np.ndarray
+    V: np.ndarray
+    distance: np.ndarray
+    demand: dict
+    capacity: float
+    speed: float
+    unload_t: float
+
+
+def _load_legacy_xlsx(path, read_distance=True):
+    """
+    Reads Params/Demand/Distance from a legacy instance xlsx with a single
+    read-only workbook open (one ZIP decompression, one XML pass) instead
+    of pandas' column-by-column boxing on top of it. When the calamine
+    Rust parser is installed it is used instead — typically another 5-20x
+    on the XML decode.
+    """
+    if importlib.util.find_spec("python_calamine") is not None:
+        import pandas as pd
+        with pd.ExcelFile(path, engine="calamine") as xl:
+            params_df = xl.parse("Params")
+            p = dict(zip(params_df["param"], params_df["value"]))
+            demand_df = xl.parse("Demand", index_col=0)
+            demand = dict(zip(demand_df.index.to_numpy().astype(int).tolist(),
+                              demand_df["demand"].to_numpy(dtype=np.float64).tolist()))
+            dist = None
+            if read_distance:
+                dist = xl.parse("Distance", index_col=0).to_numpy(dtype=np.float64)
+        return p, demand, dist
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb["Params"].iter_rows(values_only=True)
+        next(rows)  # header
+        p = {r[0]: r[1] for r in rows}
+
+        rows = wb["Demand"].iter_rows(values_only=True)
+        next(rows)  # header
+        demand = {int(r[0]): float(r[1]) for r in rows}
+
+        dist = None
+        if read_distance:
+            n = int(p["S_size"])
+            dist = np.empty((n, n), dtype=np.float64)
+            rows = wb["Distance"].iter_rows(values_only=True)
+            next(rows)  # header row holds the column ids
+            for r in rows:
+                dist[int(r[0]), :] = r[1:n + 1]
+        return p, demand, dist
+    finally:
+        wb.close()
+
+
+def pack_symmetric(distance, atol=1e-8):
+    """
+    Flat upper-triangle copy of a symmetric distance matrix: N(N+1)/2
+    entries instead of N^2, so scan-heavy consumers move half the bytes.
+    Returns None when the matrix is not symmetric — the dense ndarray
+    from load_instance stays the canonical representation; this is an
+    opt-in for bandwidth-bound loops. Entry (i, j) with j >= i lives at
+    pack_index(n, i, j).
+    """
+    dist = np.asarray(distance)
+    if not np.allclose(dist, dist.T, atol=atol):
+        return None
+    return dist[np.triu_indices(dist.shape[0])].copy()
+
+
+def pack_index(n, i, j):
+    """Flat position of (i, j), j >= i, in a pack_symmetric array."""
+    if i > j:
+        i, j = j, i
+    return i * (2 * n - i - 1) // 2 + j
+
+
+def submatrix(path, nodes):
+    """
+    Distance sub-matrix over the given node tuple for the instance at
+    `path`. Cached per (path, mtime, nodes) — like load_instance, a
+    rewritten file invalidates the entry — so sweep scripts that
+    repeatedly evaluate the same node subset get an O(1) pointer return
+    instead of re-slicing; `nodes` must be a tuple (hashable) of node
+    indices.
+    """
+    return _submatrix_cached(path, os.path.getmtime(path), nodes)
+
+
+@lru_cache(maxsize=16)
+def _submatrix_cached(path, mtime, nodes):
+    distance = load_instance(path)[2]
+    idx = np.asarray(nodes, dtype=np.intp)
+    return distance[np.ix_(idx, idx)]
+
+
+def load_instance(path, dtype=np.float64):
+    """
+    Reads an instance file at `path` (xlsx with sheets Params, Demand,
+    Distance, plus any binary sidecars written next to it).
+    Returns:
+      S, V, distance_ndarray, demand_dict, capacity, speed, unload_t
+
+    Cached per (path, mtime, dtype): parameter sweeps re-loading the same
+    instance skip all file I/O; a rewritten file invalidates the entry.
+    dtype=np.float32 halves the matrix footprint when the caller does not
+    need full double precision.
+    """
+    return _load_cached(path, os.path.getmtime(path), np.dtype(dtype).name)
+
+
+@lru_cache(maxsize=None)
+def _load_cached(path, mtime, dtype_name="float64"):
+    # prefer the binary sidecars the instance generator writes next to
+    # the xlsx (Parquet for the small sheets, raw .npy for the distance
+    # matrix); fall back to a streamed openpyxl read for legacy files
+    base = path.rsplit('.', 1)[0]
+    dist_arr = None
+    if os.path.exists(base + "_dist.npy"):
+        dist_arr = np.load(base + "_dist.npy")
+    if os.path.exists(base + "_params.parquet"):
+        # pandas is only needed for the Parquet sidecars; importing it
+        # lazily keeps it off the cold-start path of the other branches
+        import pandas as pd
+        params_df = pd.read_parquet(base + "_params.parquet")
+        demand_df = pd.read_parquet(base + "_demand.parquet")
+        p = params_df.set_index("param")["value"].to_dict()
+        # one zip over the extracted arrays instead of a label-based
+        # .loc lookup per row
+        demand = dict(zip(demand_df.index.to_numpy().astype(int).tolist(),
+                          demand_df["demand"].to_numpy(dtype=np.float64).tolist()))
+        if dist_arr is None:
+            dist_arr = pd.read_excel(path, sheet_name="Distance", index_col=0,
+                                     engine="openpyxl",
+                                     engine_kwargs={"read_only": True, "data_only": True,
+                                                    "keep_links": False}).to_numpy(dtype=np.float64)
+    else:
+        # self-written .npz cache: the first legacy parse persists its
+        # result next to the xlsx, so every later run (even in a fresh
+        # process) is a single binary np.load instead of an XML parse
+        npz_path = base + "_cache.npz"
+        if os.path.exists(npz_path) and os.path.getmtime(npz_path) >= mtime:
+            with np.load(npz_path) as z:
+                p = {"S_size": int(z["S_size"]), "V_size": int(z["V_size"]),
+                     "capacity": float(z["capacity"]), "speed": float(z["speed"]),
+                     "unload_t": float(z["unload_t"])}
+                demand = dict(zip(z["demand_ids"].tolist(),
+                                  z["demand_vals"].tolist()))
+                if dist_arr is None:
+                    dist_arr = z["distance"]
+        else:
+            p, demand, legacy_dist = _load_legacy_xlsx(path, read_distance=dist_arr is None)
+            if dist_arr is None:
+                dist_arr = legacy_dist
+                ids = np.fromiter(demand.keys(), dtype=np.int64, count=len(demand))
+                vals = np.fromiter(demand.values(), dtype=np.float64, count=len(demand))
+                try:
+                    np.savez(npz_path, distance=dist_arr,
+                             demand_ids=ids, demand_vals=vals,
+                             S_size=int(p["S_size"]), V_size=int(p["V_size"]),
+                             capacity=float(p["capacity"]), speed=float(p["speed"]),
+                             unload_t=float(p["unload_t"]))
+                except OSError:
+                    pass  # read-only instance dir: the cache is best-effort
+
+    # parse params
+    S_size   = int(p["S_size"])
+    V_size   = int(p["V_size"])
+    capacity = float(p["capacity"])
+    speed    = float(p["speed"])
+    unload_t = float(p["unload_t"])
+
+    # build sets as int32 index arrays: downstream vectorized/compiled
+    # code can index the distance matrix with them directly, and they
+    # still iterate and len() like the ranges they replace
+    S = np.arange(S_size, dtype=np.int32)
+    V = np.arange(V_size, dtype=np.int32)
+
+    # fail fast on a stale or foreign sidecar instead of with a cryptic
+    # IndexError deep inside the algorithms
+    if dist_arr.shape != (S_size, S_size):
+        raise ValueError(
+            f"{path}: distance matrix shape {dist_arr.shape} does not match S_size={S_size}")
+
+    # dense ndarray instead of an (S_size)^2 tuple-keyed dict: contiguous
+    # cells, no hashing. distance[i, j] indexing still works.
+    distance = dist_arr.astype(np.dtype(dtype_name), copy=False)
+
+    return Instance(S, V, distance, demand, capacity, speed, unload_t)
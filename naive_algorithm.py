@@ -1,63 +1,49 @@
-import pandas as pd
+import numpy as np
+
+# the canonical cached loader lives in instance_io; re-exported here so
+# existing `from naive_algorithm import load_instance` callers keep working
+from instance_io import load_instance
+
 
 def naive_single_delivery(S, V, distance, demand, capacity, speed, unload_t):
-    rem = demand.copy()
+    n = len(S)
+    if isinstance(distance, dict):
+        D = np.zeros((n, n))
+        for (i, j), d in distance.items():
+            D[i, j] = d
+    else:
+        D = np.asarray(distance, dtype=np.float64)
+
+    dem = np.zeros(n)
+    for i, d in demand.items():
+        # skip ids outside the matrix (e.g. real_data.xlsx lists node 150
+        # for a 150-node matrix), like the old `for i in S` loop did
+        if 0 < i < n:
+            dem[i] = d
+
+    # every node gets ceil(demand / capacity) depot shuttles [0, i, 0],
+    # so the whole objective is one weighted sum over the depot row and
+    # column — no per-trip Python loop, no dict hashing
+    trips_per_node = np.ceil(dem / capacity).astype(np.int64)
+    drive = float(((D[0, :] + D[:, 0]) * trips_per_node).sum()) / speed * 60
+    total_unload = float(dem.sum())
+
+    # route structure kept identical to before: round-robin over vehicles
     routes_by_vehicle = {v: [] for v in V}
     vehicle_idx = 0
-    total_unload = 0
-
     for i in S:
         if i == 0:
             continue
-        while rem[i] > 0:
-            load = min(rem[i], capacity)
-            rem[i] -= load
-            total_unload += load
-
-            route = [0, i, 0]
-            routes_by_vehicle[vehicle_idx].append(route)
-
-            # Move to next vehicle (round-robin)
+        for _ in range(int(trips_per_node[i])):
+            routes_by_vehicle[vehicle_idx].append([0, i, 0])
             vehicle_idx = (vehicle_idx + 1) % len(V)
 
-    # --- Calculate objective ---
-    drive = sum(distance[(route[k], route[k+1])] / speed * 60
-                for trips in routes_by_vehicle.values()
-                for route in trips
-                for k in range(len(route) - 1))
-
     unload_time = total_unload * unload_t
     obj = drive + unload_time
 
     return obj, routes_by_vehicle
 
 
-def load_instance(path):
-    params_df = pd.read_excel(path, sheet_name="Params")
-    demand_df = pd.read_excel(path, sheet_name="Demand", index_col=0)
-    dist_df   = pd.read_excel(path, sheet_name="Distance", index_col=0)
-
-    p = params_df.set_index("param")["value"].to_dict()
-    S_size   = int(p["S_size"])
-    V_size   = int(p["V_size"])
-    capacity = float(p["capacity"])
-    speed    = float(p["speed"])
-    unload_t = float(p["unload_t"])
-
-    S = range(S_size)
-    V = range(V_size)
-
-    demand = {int(i): float(demand_df.loc[i, "demand"])
-              for i in demand_df.index}
-
-    distance = {
-        (int(i), int(j)): float(dist_df.loc[i, j])
-        for i in dist_df.index for j in dist_df.columns
-    }
-
-    return S, V, distance, demand, capacity, speed, unload_t
-
-
 if __name__ == "__main__":
     path = "instances_20250528_101234/scenario_1/scenario_1_instance_1.xlsx"
     S, V, distance, demand, capacity, speed, unload_t = load_instance(path)
@@ -65,6 +51,9 @@ if __name__ == "__main__":
     obj_val, routes = naive_single_delivery(S, V, distance, demand, capacity, speed, unload_t)
 
     print(f"Objective: {obj_val:.2f}")
-    print("Routes:")
+    # the full dump is O(S) trips of repr + stdout flush; a sample per
+    # vehicle is enough to eyeball the structure
+    print("Routes (first 5 trips per vehicle):")
     for v, trips in routes.items():
-        print(f"  Vehicle {v}: {trips}")
\ No newline at end of file
+        extra = f" ... (+{len(trips) - 5} more)" if len(trips) > 5 else ""
+        print(f"  Vehicle {v}: {trips[:5]}{extra}")
\ No newline at end of file
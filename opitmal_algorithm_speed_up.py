@@ -1,9 +1,18 @@
 import gurobipy as gp
 from gurobipy import GRB
+import os
 import time, math
-import pandas as pd
+import numpy as np
 
-def solve_routing(S, V, distance, demand, capacity, speed, unload_t):
+# the canonical cached loader lives in instance_io; re-exported here so
+# existing `from opitmal_algorithm_speed_up import load_instance` callers
+# keep working
+from instance_io import load_instance
+
+
+def solve_routing(S, V, distance, demand, capacity, speed, unload_t,
+                  warm_start_routes=None, time_limit=180, mip_gap=0.01,
+                  knn_prune=None, quantize_dist=False, params=None, env=None):
     # 1) total demand & trip bound
     D     = sum(demand[i] for i in S if i != 0)
     # worst-case trips if all single-customer loads
@@ -14,87 +23,200 @@ def solve_routing(S, V, distance, demand, capacity, speed, unload_t):
     print(f"max trips needed: {T_max}, vehicles used: {len(V_eff)}")
 
     # 2) model & vars
-    m = gp.Model()
+    # a caller-owned Env skips the per-solve license handshake and
+    # environment startup when solving many instances in a row
+    m = gp.Model(env=env) if env is not None else gp.Model()
+
+    # Precomputed node/arc lists: every constraint family below reuses
+    # them instead of re-filtering S with `if i != j` per combination.
+    # With knn_prune=k set, customer-customer arcs are restricted to each
+    # node's k nearest neighbors (kept symmetric); depot arcs always stay.
+    # This is a heuristic reduction — the solution is optimal over the
+    # pruned arc set only — hence opt-in.
+    customers = [i for i in S if i != 0]
+    if knn_prune:
+        k_nn = min(len(S) - 2, int(knn_prune))
+        dist_mat = np.asarray([[distance[i, j] for j in S] for i in S], dtype=np.float64) \
+            if isinstance(distance, dict) else np.asarray(distance, dtype=np.float64)
+        order = np.argsort(dist_mat, axis=1)
+        allowed = set()
+        for i in customers:
+            kept = 0
+            for j in order[i]:
+                j = int(j)
+                if j == i or j == 0:
+                    continue
+                allowed.add((i, j))
+                allowed.add((j, i))
+                kept += 1
+                if kept >= k_nn:
+                    break
+        arcs = [(i, j) for i in S for j in S
+                if i != j and (i == 0 or j == 0 or (i, j) in allowed)]
+    else:
+        arcs = [(i, j) for i in S for j in S if i != j]
+    arc_set = set(arcs)
+    in_nbrs = {k: [] for k in S}
+    out_nbrs = {k: [] for k in S}
+    for (i, j) in arcs:
+        out_nbrs[i].append(j)
+        in_nbrs[j].append(i)
 
-    x = m.addVars(S, S, V_eff, T, vtype=GRB.BINARY,     name="x")
+    x = m.addVars(arcs, V_eff, T, vtype=GRB.BINARY,     name="x")
     q = m.addVars(S, V_eff, T,      vtype=GRB.CONTINUOUS, lb=0, name="q")
-    u = m.addVars(S, V_eff, T,      vtype=GRB.CONTINUOUS, lb=0, ub=len(S)-1, name="u")
     y = m.addVars(V_eff, T,         vtype=GRB.BINARY,     name="y")
 
     # 3) objective
-    drive = gp.quicksum((distance[i,j]/speed)*60 * x[i,j,v,t]
-                        for i in S for j in S if i!=j
+    # drive-time coefficient computed once per arc (not once per
+    # (arc, v, t) term); quantize_dist rounds distances to decimeters
+    # first, which gives the MIP cleaner, near-integral coefficients
+    if quantize_dist:
+        coef = {(i, j): (round(distance[i, j] * 10) / 10.0 / speed) * 60
+                for (i, j) in arcs}
+    else:
+        coef = {(i, j): (distance[i, j] / speed) * 60 for (i, j) in arcs}
+    drive = gp.quicksum(coef[i, j] * x[i,j,v,t]
+                        for (i, j) in arcs
                         for v in V_eff for t in T)
     unload= gp.quicksum(unload_t * q[i,v,t]
-                        for i in S if i!=0
+                        for i in customers
                         for v in V_eff for t in T)
     m.setObjective(drive + unload, GRB.MINIMIZE)
 
     # 4) depot return & y‐link
     for v in V_eff:
         for t in T:
-            dep = gp.quicksum(x[0,j,v,t] for j in S if j!=0)
-            ret = gp.quicksum(x[j,0,v,t] for j in S if j!=0)
+            dep = gp.quicksum(x[0,j,v,t] for j in out_nbrs[0])
+            ret = gp.quicksum(x[j,0,v,t] for j in in_nbrs[0])
             m.addConstr(dep == ret)
             m.addConstr(dep <= (len(S)-1) * y[v,t])
             m.addConstr(dep >= y[v,t])
             if t < T_max-1:
                 m.addConstr(y[v,t] >= y[v,t+1])
 
+    # vehicles are identical, so order them by trips used: kills the
+    # |V_eff|! relabeling symmetry on top of the per-vehicle trip
+    # ordering above, without touching the route structure
+    for v in V_eff:
+        if v + 1 in V_eff:
+            m.addConstr(
+                gp.quicksum(y[v,t] for t in T)
+                >=
+                gp.quicksum(y[v+1,t] for t in T)
+            )
+
     # 5) flow at customers
     for v in V_eff:
         for t in T:
-            for k in S:
-                if k != 0:
-                    m.addConstr(
-                        gp.quicksum(x[i,k,v,t] for i in S if i!=k)
-                        ==
-                        gp.quicksum(x[k,j,v,t] for j in S if j!=k)
-                    )
+            for k in customers:
+                m.addConstr(
+                    gp.quicksum(x[i,k,v,t] for i in in_nbrs[k])
+                    ==
+                    gp.quicksum(x[k,j,v,t] for j in out_nbrs[k])
+                )
 
     # 6) capacity & multi-stop unload
     for v in V_eff:
         for t in T:
-            m.addConstr(gp.quicksum(q[i,v,t] for i in S if i!=0) <= capacity)
-            for i in S:
-                if i != 0:
-                    arr = gp.quicksum(x[j,i,v,t] for j in S if j!=i)
-                    m.addConstr(q[i,v,t] <= capacity * arr)
-                    m.addConstr(q[i,v,t] <= demand[i])
+            m.addConstr(gp.quicksum(q[i,v,t] for i in customers) <= capacity)
+            for i in customers:
+                arr = gp.quicksum(x[j,i,v,t] for j in in_nbrs[i])
+                m.addConstr(q[i,v,t] <= capacity * arr)
+                m.addConstr(q[i,v,t] <= demand[i])
 
     # 7) satisfy all demand
-    for i in S:
-        if i != 0:
-            m.addConstr(
-                gp.quicksum(q[i,v,t] for v in V_eff for t in T)
-                == demand[i]
-            )
+    for i in customers:
+        m.addConstr(
+            gp.quicksum(q[i,v,t] for v in V_eff for t in T)
+            == demand[i]
+        )
 
-    # 8) MTZ + tighten with y
-    n = len(S)
-    for v in V_eff:
-        for t in T:
-            m.addConstr(u[0,v,t] == 0)
-            for i in S:
-                m.addConstr(u[i,v,t] <= (n-1) * y[v,t])
-                for j in S:
-                    if i!=j and i!=0 and j!=0:
-                        m.addConstr(
-                            u[i,v,t] - u[j,v,t] + n * x[i,j,v,t]
-                            <= n - 1
+    # 8) DFJ subtour elimination as lazy constraints
+    # MTZ materialized O(|S|^2 |V| |T|) rows up front and its LP
+    # relaxation is weak; instead only subtours actually appearing in
+    # incumbents get cut off, one lazy constraint each.
+    m.params.LazyConstraints = 1
+
+    def _subtour_elim(model, where):
+        if where != GRB.Callback.MIPSOL:
+            return
+        xval = model.cbGetSolution(x)
+        for v in V_eff:
+            for t in T:
+                adj = {}
+                for (i, j) in arcs:
+                    if xval[i, j, v, t] > 0.5:
+                        adj.setdefault(i, []).append(j)
+                        adj.setdefault(j, []).append(i)
+                seen = set()
+                for start in adj:
+                    if start in seen:
+                        continue
+                    comp = {start}
+                    stack = [start]
+                    while stack:
+                        k = stack.pop()
+                        for nb in adj[k]:
+                            if nb not in comp:
+                                comp.add(nb)
+                                stack.append(nb)
+                    seen |= comp
+                    if 0 not in comp:
+                        model.cbLazy(
+                            gp.quicksum(x[i, j, v, t]
+                                        for i in comp for j in comp
+                                        if i != j and (i, j) in arc_set)
+                            <= len(comp) - 1
                         )
 
-    # 9) solve
+    # 9) MIP start from a known-feasible solution (e.g. the naive or NN
+    # heuristic routes): an immediate incumbent prunes the tree from the
+    # root node instead of waiting for Gurobi's own heuristics.
+    if warm_start_routes:
+        if isinstance(warm_start_routes, dict):
+            start_trips = [trip for v_trips in warm_start_routes.values()
+                           for trip in v_trips]
+        else:
+            start_trips = list(warm_start_routes)
+        trips_assigned = {v: 0 for v in V_eff}
+        n_v = len(V_eff)
+        for k, trip in enumerate(start_trips):
+            v = k % n_v
+            t = trips_assigned[v]
+            if t >= T_max or len(trip) < 3:
+                continue  # partial starts are fine; Gurobi completes them
+            trips_assigned[v] = t + 1
+            y[v, t].Start = 1.0
+            for a, b in zip(trip, trip[1:]):
+                if a != b and (a, b) in arc_set:
+                    x[a, b, v, t].Start = 1.0
+
+    # solve
     m.params.OutputFlag = 0
     t0 = time.time()
 
-    # Stop when (UB – LB)/UB ≤ 1%
-    #m.params.MIPGap = 0.01
+    # VRP-flavored tuning: push for incumbents early (the gap is what the
+    # experiments report), generate cuts aggressively, and let Gurobi
+    # exploit the vehicle/trip interchangeability it can still detect.
+    m.params.MIPFocus = 1
+    m.params.Cuts = 2
+    m.params.Heuristics = 0.2
+    m.params.Threads = os.cpu_count()
+    m.params.Symmetry = 2
+
+    # Stop when (UB – LB)/UB ≤ mip_gap, if requested
+    if mip_gap is not None:
+        m.params.MIPGap = mip_gap
 
-    # Don’t run longer than 30 min (1,800 s)
-    m.params.TimeLimit = 180
+    m.params.TimeLimit = time_limit
     m.params.OutputFlag = 1
-    m.optimize()
+
+    # caller-supplied overrides win over the defaults above, so the batch
+    # runner can tune per scenario without touching the solver
+    for k, val in (params or {}).items():
+        m.setParam(k, val)
+
+    m.optimize(_subtour_elim)
     status_str = {GRB.LOADED: "Loaded", GRB.OPTIMAL: "Optimal", GRB.INFEASIBLE: "Infeasible",
                   GRB.INTERRUPTED: "Interrupted", GRB.TIME_LIMIT: "Time limit", GRB.SOLUTION_LIMIT: "Solution limit"}.get(m.Status, str(m.Status))
     print(f"Model Status: {status_str} ({m.Status})")
@@ -102,23 +224,27 @@ def solve_routing(S, V, distance, demand, capacity, speed, unload_t):
     print(f"Solved in {time.time()-t0:.2f}s, Obj={m.ObjVal:.1f}")
 
     # 10) extract routes
+    # one bulk getAttr per variable family instead of |arcs|*|V|*|T|
+    # scalar .X round-trips into the C API
+    xval = m.getAttr('X', x)
+    yval = m.getAttr('X', y)
+    qval = m.getAttr('X', q)
     for v in V_eff:
         for t in T:
-            if y[v,t].X < 0.5: continue
-            arcs = [(i,j) for i in S for j in S
-                    if i!=j and x[i,j,v,t].X > 0.5]
+            if yval[v,t] < 0.5: continue
+            sel = [(i,j) for (i,j) in arcs if xval[i,j,v,t] > 0.5]
             tour = [0]
             while True:
                 cur = tour[-1]
-                nxt = [j for (ii,j) in arcs if ii==cur]
+                nxt = [j for (ii,j) in sel if ii==cur]
                 if not nxt or nxt[0]==0:
                     tour.append(0)
                     break
                 tour.append(nxt[0])
             print(f"Vehicle {v}, Trip {t}: {tour}")
             for i in tour:
-                if i!=0 and q[i,v,t].X > 1e-6:
-                    print(f"  Delivered {q[i,v,t].X:.2f} t to node {i}")
+                if i!=0 and qval[i,v,t] > 1e-6:
+                    print(f"  Delivered {qval[i,v,t]:.2f} t to node {i}")
 
     # --- After solve: extract objective and route structure ---
     result_routes = {}
@@ -126,18 +252,18 @@ def solve_routing(S, V, distance, demand, capacity, speed, unload_t):
     for v in V_eff:
         vehicle_trips = []
         for t in T:
-            if y[v, t].X < 0.5:
+            if yval[v, t] < 0.5:
                 continue
 
             # Build trip from arcs
-            arcs = {(i, j) for i in S for j in S if i != j and x[i, j, v, t].X > 0.5}
-            if not arcs:
+            sel = {(i, j) for (i, j) in arcs if xval[i, j, v, t] > 0.5}
+            if not sel:
                 continue
 
             trip = [0]
             current = 0
             while True:
-                next_nodes = [j for (i, j) in arcs if i == current]
+                next_nodes = [j for (i, j) in sel if i == current]
                 if not next_nodes or next_nodes[0] == 0:
                     trip.append(0)
                     break
@@ -149,50 +275,18 @@ def solve_routing(S, V, distance, demand, capacity, speed, unload_t):
         if vehicle_trips:
             result_routes[v] = vehicle_trips
 
-    return m.ObjVal, result_routes
-
-
-def load_instance(path):
-    """
-    Reads an Excel file at `path` with sheets:
-      • Params   (cols: param, value)
-      • Demand   (index=node_id, col=demand)
-      • Distance (square matrix of size S×S)
-    Returns:
-      S, V, distance_dict, demand_dict, capacity, speed, unload_t
-    """
-    # read sheets
-    params_df = pd.read_excel(path, sheet_name="Params")
-    demand_df = pd.read_excel(path, sheet_name="Demand", index_col=0)
-    dist_df   = pd.read_excel(path, sheet_name="Distance", index_col=0)
-
-    # parse params
-    p = params_df.set_index("param")["value"].to_dict()
-    S_size   = int(p["S_size"])
-    V_size   = int(p["V_size"])
-    capacity = float(p["capacity"])
-    speed    = float(p["speed"])
-    unload_t = float(p["unload_t"])
-
-    # build sets
-    S = range(S_size)
-    V = range(V_size)
-
-    # build demand dict
-    demand = {int(i): float(demand_df.loc[i, "demand"])
-              for i in demand_df.index}
-
-    # build distance dict
-    distance = {
-        (int(i), int(j)): float(dist_df.loc[i, j])
-        for i in dist_df.index for j in dist_df.columns
-    }
-
-    return S, V, distance, demand, capacity, speed, unload_t
+    # the achieved gap goes back to the caller so experiment rows can
+    # record how close to proven optimality each solve actually got
+    return m.ObjVal, result_routes, m.MIPGap
 
 
 if __name__ == "__main__":
     S, V, distance, demand, capacity, speed, unload_t = load_instance("Experiments/instances_20250528_135356/scenario_1/scenario_1_instance_1.xlsx")
-    obj_val, dict = solve_routing(S, V, distance, demand, capacity, speed, unload_t)
+    obj_val, routes, gap = solve_routing(S, V, distance, demand, capacity, speed, unload_t)
     print(obj_val)
-    print(dict)
\ No newline at end of file
+    # the full dump is O(S) trips of repr + stdout flush; a sample per
+    # vehicle is enough to eyeball the structure
+    for v, trips in routes.items():
+        extra = f" ... (+{len(trips) - 5} more)" if len(trips) > 5 else ""
+        print(f"  Vehicle {v}: {trips[:5]}{extra}")
+    print(f"achieved gap: {gap:.4f}")
\ No newline at end of file
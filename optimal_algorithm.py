@@ -1,13 +1,19 @@
 import gurobipy as gp
 from gurobipy import GRB
+import os
 import time
 import math
-import pandas as pd
+import numpy as np
+
+# the canonical cached loader lives in instance_io; re-exported here so
+# existing `from optimal_algorithm import load_instance` callers keep working
+from instance_io import load_instance
 
 def solve_routing(S, V,
                   distance, demand,
                   capacity, speed,
-                  unload_t):
+                  unload_t,
+                  time_limit=120, mip_gap=None, params=None, env=None):
     """
     S: iterable of nodes (0 = depot)
     V: iterable of vehicles
@@ -18,6 +24,18 @@ def solve_routing(S, V,
     unload_t: minutes to unload 1 ton
     """
 
+    # densify a legacy tuple-keyed dict; with an ndarray the conversion
+    # is free. travel_min folds the /speed*60 scaling into one array op
+    # so the objective build below is pure lookups, no hashing.
+    n_nodes = len(S)
+    if isinstance(distance, dict):
+        dist_arr = np.zeros((n_nodes, n_nodes))
+        for (i, j), d in distance.items():
+            dist_arr[i, j] = d
+    else:
+        dist_arr = np.asarray(distance, dtype=np.float64)
+    travel_min = dist_arr * (60.0 / speed)
+
     # 1) Compute worst‐case number of trips
     D = sum(demand[i] for i in S if i != 0)
     T_max = math.ceil(D / (capacity * len(V)))
@@ -25,17 +43,27 @@ def solve_routing(S, V,
     print(f"maximum number of trips needed: {T_max}")
 
     # 2) Build model
-    m = gp.Model()
-    x = m.addVars(S, S, V, T, vtype=GRB.BINARY, name="x")
+    # a caller-owned Env skips the per-solve license handshake and
+    # environment startup when solving many instances in a row
+    m = gp.Model(env=env) if env is not None else gp.Model()
+
+    # Precomputed node/arc lists: every constraint family below reuses
+    # them instead of re-filtering S with `if i != j` per combination.
+    customers = [i for i in S if i != 0]
+    arcs = [(i, j) for i in S for j in S if i != j]
+    S_minus = {k: [i for i in S if i != k] for k in S}
+
+    # variables only over real arcs: the |S| self-loops x[i,i,...] per
+    # (v, t) were never referenced, they just bloated the model
+    x = m.addVars(arcs, V, T, vtype=GRB.BINARY, name="x")
     q = m.addVars(S, V, T, vtype=GRB.CONTINUOUS, lb=0, name="q")
-    u = m.addVars(S, V, T, vtype=GRB.CONTINUOUS, lb=0, ub=len(S)-1, name="u")
 
     # 3) Objective: drive time + unload time
-    drive_time = gp.quicksum((distance[i,j]/speed)*60 * x[i,j,v,t]
-                             for i in S for j in S if i != j
+    drive_time = gp.quicksum(travel_min[i, j] * x[i,j,v,t]
+                             for (i, j) in arcs
                              for v in V for t in T)
     unload_time = gp.quicksum(unload_t * q[i,v,t]
-                              for i in S if i != 0
+                              for i in customers
                               for v in V for t in T)
 
     m.setObjective(drive_time + unload_time, GRB.MINIMIZE)
@@ -44,127 +72,137 @@ def solve_routing(S, V,
     for v in V:
         for t in T:
             m.addConstr(
-                gp.quicksum(x[0,j,v,t] for j in S if j != 0)
+                gp.quicksum(x[0,j,v,t] for j in customers)
                 ==
-                gp.quicksum(x[j,0,v,t] for j in S if j != 0)
+                gp.quicksum(x[j,0,v,t] for j in customers)
             )
 
     # 5) Flow conservation at customer nodes
     for v in V:
         for t in T:
-            for k in S:
-                if k != 0:
-                    m.addConstr(
-                        gp.quicksum(x[i,k,v,t] for i in S if i != k)
-                        ==
-                        gp.quicksum(x[k,j,v,t] for j in S if j != k)
-                    )
+            for k in customers:
+                m.addConstr(
+                    gp.quicksum(x[i,k,v,t] for i in S_minus[k])
+                    ==
+                    gp.quicksum(x[k,j,v,t] for j in S_minus[k])
+                )
 
     # 6) Capacity & demand
     for v in V:
         for t in T:
             # total load on trip ≤ capacity
             m.addConstr(
-                gp.quicksum(q[i,v,t] for i in S if i != 0)
+                gp.quicksum(q[i,v,t] for i in customers)
                 <= capacity
             )
-            for i in S:
-                if i != 0:
-                    # can unload only if arc arrives
-                    m.addConstr(
-                        q[i,v,t]
-                        <= capacity * gp.quicksum(x[j,i,v,t] for j in S if j != i)
-                    )
-                    m.addConstr(q[i,v,t] <= demand[i])
+            for i in customers:
+                # can unload only if arc arrives
+                m.addConstr(
+                    q[i,v,t]
+                    <= capacity * gp.quicksum(x[j,i,v,t] for j in S_minus[i])
+                )
+                m.addConstr(q[i,v,t] <= demand[i])
 
     # each demand must be exactly met
-    for i in S:
-        if i != 0:
-            m.addConstr(
-                gp.quicksum(q[i,v,t] for v in V for t in T)
-                == demand[i]
-            )
-
-    # 7) MTZ subtour elimination
-    n = len(S)
-    for v in V:
-        for t in T:
-            m.addConstr(u[0,v,t] == 0)
-            for i in S:
-                for j in S:
-                    if i != j and i != 0 and j != 0:
-                        m.addConstr(
-                            u[i,v,t] - u[j,v,t] + n * x[i,j,v,t]
-                            <= n - 1
+    for i in customers:
+        m.addConstr(
+            gp.quicksum(q[i,v,t] for v in V for t in T)
+            == demand[i]
+        )
+
+    # Vehicles are interchangeable (same capacity/speed), so order them by
+    # first-trip load: any solution can be relabeled to satisfy this, and
+    # it prunes the |V|! label permutations from the branch tree.
+    V_list = list(V)
+    for a, b in zip(V_list, V_list[1:]):
+        m.addConstr(
+            gp.quicksum(q[i,a,0] for i in customers)
+            >=
+            gp.quicksum(q[i,b,0] for i in customers)
+        )
+
+    # 7) DFJ subtour elimination as lazy constraints
+    # MTZ materialized O(|S|^2 |V| |T|) weak rows up front; instead only
+    # subtours actually appearing in incumbents get cut off, one lazy
+    # constraint each, and the u position variables disappear entirely.
+    m.params.LazyConstraints = 1
+
+    def _subtour_elim(model, where):
+        if where != GRB.Callback.MIPSOL:
+            return
+        xval = model.cbGetSolution(x)
+        for v in V:
+            for t in T:
+                adj = {}
+                for (i, j) in arcs:
+                    if xval[i, j, v, t] > 0.5:
+                        adj.setdefault(i, []).append(j)
+                        adj.setdefault(j, []).append(i)
+                seen = set()
+                for start in adj:
+                    if start in seen:
+                        continue
+                    comp = {start}
+                    stack = [start]
+                    while stack:
+                        k = stack.pop()
+                        for nb in adj[k]:
+                            if nb not in comp:
+                                comp.add(nb)
+                                stack.append(nb)
+                    seen |= comp
+                    if 0 not in comp:
+                        model.cbLazy(
+                            gp.quicksum(x[i, j, v, t]
+                                        for i in comp for j in comp
+                                        if i != j)
+                            <= len(comp) - 1
                         )
 
     # 8) Solve
-    m.params.TimeLimit = 120
+    # VRP-flavored tuning: push for incumbents early, generate cuts
+    # aggressively, and let Gurobi exploit vehicle/trip symmetry.
+    m.params.MIPFocus = 1
+    m.params.Cuts = 2
+    m.params.Heuristics = 0.2
+    m.params.Threads = os.cpu_count()
+    m.params.Symmetry = 2
+    if mip_gap is not None:
+        m.params.MIPGap = mip_gap
+    m.params.TimeLimit = time_limit
     m.params.OutputFlag = 1
+    # caller-supplied overrides win over the defaults above
+    for k, val in (params or {}).items():
+        m.setParam(k, val)
     t0 = time.time()
-    m.optimize()
+    m.optimize(_subtour_elim)
     runtime = time.time() - t0
 
     # 9) Extract and print routes
+    # one bulk getAttr per variable family instead of |S|^2*|V|*|T|
+    # scalar .X round-trips into the C API
+    xval = m.getAttr('X', x)
+    qval = m.getAttr('X', q)
     for v in V:
         for t in T:
-            arcs = [(i,j) for i in S for j in S if i!=j and x[i,j,v,t].X > 0.5]
-            if arcs:
+            sel = [(i,j) for (i,j) in arcs if xval[i,j,v,t] > 0.5]
+            if sel:
                 tour = [0]
                 while True:
                     i = tour[-1]
-                    legs = [j for (ii,j) in arcs if ii == i]
+                    legs = [j for (ii,j) in sel if ii == i]
                     if not legs or legs[0] == 0:
                         tour.append(0)
                         break
                     tour.append(legs[0])
                 print(f"Vehicle {v}, Trip {t}: {tour}")
                 for i in tour:
-                    if i != 0 and q[i,v,t].X > 1e-6:
-                        print(f"  Delivered to {i}: {q[i,v,t].X:.2f} tons")
+                    if i != 0 and qval[i,v,t] > 1e-6:
+                        print(f"  Delivered to {i}: {qval[i,v,t]:.2f} tons")
 
     return m.ObjVal, runtime
 
 
-def load_instance(path):
-    """
-    Reads an Excel file at `path` with sheets:
-      • Params   (cols: param, value)
-      • Demand   (index=node_id, col=demand)
-      • Distance (square matrix of size S×S)
-    Returns:
-      S, V, distance_dict, demand_dict, capacity, speed, unload_t
-    """
-    # read sheets
-    params_df = pd.read_excel(path, sheet_name="Params")
-    demand_df = pd.read_excel(path, sheet_name="Demand", index_col=0)
-    dist_df   = pd.read_excel(path, sheet_name="Distance", index_col=0)
-
-    # parse params
-    p = params_df.set_index("param")["value"].to_dict()
-    S_size   = int(p["S_size"])
-    V_size   = int(p["V_size"])
-    capacity = float(p["capacity"])
-    speed    = float(p["speed"])
-    unload_t = float(p["unload_t"])
-
-    # build sets
-    S = range(S_size)
-    V = range(V_size)
-
-    # build demand dict
-    demand = {int(i): float(demand_df.loc[i, "demand"])
-              for i in demand_df.index}
-
-    # build distance dict
-    distance = {
-        (int(i), int(j)): float(dist_df.loc[i, j])
-        for i in dist_df.index for j in dist_df.columns
-    }
-
-    return S, V, distance, demand, capacity, speed, unload_t
-
-
 if __name__ == "__main__":
     S, V, distance, demand, capacity, speed, unload_t = load_instance("Experiments/instances_20250528_135356/scenario_1/scenario_1_instance_1.xlsx")
     obj_val, dict = solve_routing(S, V, distance, demand, capacity, speed, unload_t)
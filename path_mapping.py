@@ -1,10 +1,17 @@
+import re
+
+import numpy as np
 import pandas as pd
-import shapely.geometry as geom
+import shapely
 import geopandas as gpd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.collections import LineCollection
 from matplotlib.lines import Line2D
 
+# matches signed floats inside "[lon, lat]"-style coordinate strings
+_COORD_PAT = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+
 
 def plot_shelter_trips(excel_path, vehicle_routes):
     """
@@ -26,8 +33,12 @@ def plot_shelter_trips(excel_path, vehicle_routes):
         gdf_trip_legs (GeoDataFrame): LineString geometries of each trip leg.
         gdf_shelters  (GeoDataFrame): Point geometries of all shelters.
     """
-    # 1) load coordinates
-    df = pd.read_excel(excel_path, sheet_name='Coordinates')
+    # 1) load coordinates — read-only/data-only keeps openpyxl from
+    # building the full writable workbook model for an ingest-only read
+    df = pd.read_excel(excel_path, sheet_name='Coordinates',
+                       engine='openpyxl',
+                       engine_kwargs={'read_only': True, 'data_only': True,
+                                      'keep_links': False})
     cols = {c.lower(): c for c in df.columns}
 
     # identify ID column
@@ -48,13 +59,15 @@ def plot_shelter_trips(excel_path, vehicle_routes):
         df['Longitude'] = df[cols['x']].astype(float)
         df['Latitude'] = df[cols['y']].astype(float)
     elif 'coordinates' in cols:
-        df[['Longitude','Latitude']] = (
-            df[cols['coordinates']]
-              .astype(str)
-              .str.strip('[]() ')
-              .str.split(',', expand=True)
-              .astype(float)
+        # one compiled-regex pass per cell instead of three full-column
+        # StringArray passes (strip, split, astype)
+        parsed = np.array(
+            [_COORD_PAT.findall(str(s))[:2]
+             for s in df[cols['coordinates']].to_numpy()],
+            dtype=np.float64
         )
+        df['Longitude'] = parsed[:, 0]
+        df['Latitude'] = parsed[:, 1]
     else:
         raise KeyError(
             f"'Coordinates' sheet must have either 'Longitude' & 'Latitude', 'x' & 'y', or 'coordinates'; found: {list(df.columns)}"
@@ -64,35 +77,37 @@ def plot_shelter_trips(excel_path, vehicle_routes):
     df = df.rename(columns={id_col: 'shelter_id'}).set_index('shelter_id')
 
     # 2) build trip legs
-    legs = []
+    # collect the leg endpoints first, then resolve all coordinates with
+    # one fancy-indexed array lookup instead of two df.loc calls per leg
+    pos = {label: k for k, label in enumerate(df.index)}
+    vehicle_ids, trip_ids, origins, destinations = [], [], [], []
     for vid, routes in vehicle_routes.items():
         for trip_idx, route in enumerate(routes):
-            for i in range(len(route) - 1):
-                o, d = route[i], route[i+1]
-                if o not in df.index or d not in df.index:
+            for o, d in zip(route, route[1:]):
+                if o not in pos or d not in pos:
                     continue
-                olon, olat = df.loc[o, ['Longitude', 'Latitude']]
-                dlon, dlat = df.loc[d, ['Longitude', 'Latitude']]
-                legs.append({
-                    'vehicle_id': vid,
-                    'trip_id': f"{vid}_{trip_idx}",
-                    'origin': o,
-                    'destination': d,
-                    'Origin Lon': olon,
-                    'Origin Lat': olat,
-                    'Destination Lon': dlon,
-                    'Destination Lat': dlat,
-                })
-    df_legs = pd.DataFrame(legs)
-
-    # 3) GeoDataFrame of lines
-    df_legs['geometry'] = df_legs.apply(
-        lambda r: geom.LineString([
-            geom.Point(r['Origin Lon'], r['Origin Lat']),
-            geom.Point(r['Destination Lon'], r['Destination Lat'])
-        ]),
-        axis=1
-    )
+                vehicle_ids.append(vid)
+                trip_ids.append(f"{vid}_{trip_idx}")
+                origins.append(o)
+                destinations.append(d)
+
+    coords = df[['Longitude', 'Latitude']].to_numpy(dtype=float)
+    orig_xy = coords[[pos[o] for o in origins]]
+    dest_xy = coords[[pos[d] for d in destinations]]
+    df_legs = pd.DataFrame({
+        'vehicle_id': vehicle_ids,
+        'trip_id': trip_ids,
+        'origin': origins,
+        'destination': destinations,
+        'Origin Lon': orig_xy[:, 0],
+        'Origin Lat': orig_xy[:, 1],
+        'Destination Lon': dest_xy[:, 0],
+        'Destination Lat': dest_xy[:, 1],
+    })
+
+    # 3) GeoDataFrame of lines — one vectorized GEOS call builds every
+    # LineString at once (Shapely 2.x), no row-at-a-time apply
+    df_legs['geometry'] = shapely.linestrings(np.stack([orig_xy, dest_xy], axis=1))
     gdf_trip_legs = gpd.GeoDataFrame(df_legs, geometry='geometry', crs='EPSG:4326')
 
     # 4) GeoDataFrame of points
@@ -118,23 +133,25 @@ def plot_shelter_trips(excel_path, vehicle_routes):
         hub = gdf_shelters[mask_hub]
         hub.plot(ax=ax, color='green', marker='*', markersize=250, label='Shelter 0 (Hub)')
 
-    # plot trip legs by vehicle color
+    # plot trip legs by vehicle color — one batched LineCollection for
+    # all legs instead of a full GeoPandas plot pass per vehicle
     vehicles = sorted(gdf_trip_legs['vehicle_id'].unique())
     palette = plt.cm.get_cmap('tab20', len(vehicles))
     color_map = {v: palette(i) for i, v in enumerate(vehicles)}
+    segments = np.stack([orig_xy, dest_xy], axis=1)
+    seg_colors = [color_map[v] for v in df_legs['vehicle_id']]
+    ax.add_collection(LineCollection(segments, colors=seg_colors,
+                                     linewidths=2, alpha=0.8))
+    # the collection is a single artist, so legend entries are proxies
     for vid in vehicles:
-        subset = gdf_trip_legs[gdf_trip_legs['vehicle_id'] == vid]
-        subset.plot(ax=ax, color=color_map[vid], linewidth=2, alpha=0.8,
-                    label=f'Vehicle {vid}')
-
-        # compute full data extents
-    xs = [pt.x for pt in gdf_shelters.geometry]
-    ys = [pt.y for pt in gdf_shelters.geometry]
-    for line in gdf_trip_legs.geometry:
-        xs.extend([coord[0] for coord in line.coords])
-        ys.extend([coord[1] for coord in line.coords])
-    minx, maxx = min(xs), max(xs)
-    miny, maxy = min(ys), max(ys)
+        ax.add_line(Line2D([], [], color=color_map[vid], linewidth=2,
+                           label=f'Vehicle {vid}'))
+
+    # compute full data extents via GEOS' native envelopes instead of
+    # iterating every vertex in Python
+    bounds = np.vstack([gdf_shelters.total_bounds, gdf_trip_legs.total_bounds])
+    minx, miny = bounds[:, :2].min(axis=0)
+    maxx, maxy = bounds[:, 2:].max(axis=0)
     # ensure equal numeric spans on both axes
     lon_span = maxx - minx
     lat_span = maxy - miny